@@ -1,10 +1,11 @@
 from decimal import Decimal
 from billing.models import WalletAccount
-print(WalletAccount.objects.filter(available__gte=Decimal()))
-for a in WalletAccount.objects.filter(available__gte=Decimal()):
-	a.available = Decimal()
-	a.current = Decimal()
-	a.reserved = Decimal()
-	a.uncleared = Decimal()
-	a.save()
 
+# One bulk UPDATE instead of a fetch plus save per account.
+updated = WalletAccount.objects.filter(available__gte=Decimal()).update(
+	available=Decimal(),
+	current=Decimal(),
+	reserved=Decimal(),
+	uncleared=Decimal(),
+)
+print(f"Zeroed {updated} wallet accounts")
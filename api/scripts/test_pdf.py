@@ -1,17 +1,11 @@
 from datetime import timedelta
-from django.conf import settings
 from django.utils import timezone
 from base.backend.service import WalletTransactionService
 from billing.backend.interfaces.payment import RejectPaymentTransaction, ApprovePaymentTransaction
 from billing.backend.interfaces.topup import RejectTopupTransaction, ApproveTopupTransaction
-from billing.itergrations.pesaway import PesaWayAPIClient
+from billing.itergrations.pesaway import get_pesaway_client
 from billing.views import TransactionStatus
-client = PesaWayAPIClient(
-    client_id=settings.PESAWAY_CLIENT_ID,
-    client_secret=settings.PESAWAY_CLIENT_SECRET,
-    base_url=getattr(settings, "PESAWAY_BASE_URL", "https://api.pesaway.com"),
-    timeout=getattr(settings, "PESAWAY_TIMEOUT", 30),
-)
+client = get_pesaway_client()
 service = WalletTransactionService()
 processed_count = 0
 processors = {
@@ -158,7 +158,7 @@ class InterfaceBase:
 						description=description,
 						**kwargs
 					)
-					print("Results from %s: %s" % (rule.name, results))
+					log.debug("Results from %s: %s", rule.name, results)
 					if results is None:
 						BalanceLogService().update(balance_log.id, state=failed_state)
 						raise Exception(
@@ -230,7 +230,6 @@ class InterfaceBase:
 			if balance_log_ids:
 				BalanceLogService().filter(id__in=balance_log_ids).update(state=complete_state)
 				balance_log_entries = BalanceLogEntryService().filter(process_log__id__in=balance_log_ids)
-				print(balance_log_entries)
 				if balance_log_entries:
 					balance_log_entries.update(state=complete_state)
 			return transaction_obj
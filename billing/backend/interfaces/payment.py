@@ -1,10 +1,8 @@
 import logging
 from decimal import Decimal, InvalidOperation
 from typing import Dict, Any, Optional, Union
-from django.db import transaction
-from billing.helpers.generate_unique_ref import TransactionRefGenerator
 from contributions.backend.services import ContributionService
-from typing import Dict, Any, Optional
+from django.db import transaction
 from django.db import transaction as trx
 from base.backend.service import (
     WalletTransactionService,
@@ -76,17 +74,8 @@ class InitiatePayment(InterfaceBase):
         except (ValueError, TypeError, InvalidOperation):
             return False, None
     
-    def _validate_inputs(self, contribution_id: int, **kwargs) -> Optional[Dict[str, Any]]:
-        if not contribution_id:
-            return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-        try:
-            contribution = ContributionService().get(
-                id=contribution_id,
-            )
-            print(contribution)
-            if not contribution:
-                return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-        except Exception:
+    def _validate_inputs(self, contribution, **kwargs) -> Optional[Dict[str, Any]]:
+        if not contribution:
             return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
         amount = kwargs.get("amount")
         is_valid_amount, decimal_amount = self._validate_amount(amount)
@@ -108,16 +97,6 @@ class InitiatePayment(InterfaceBase):
             log.exception("Error fetching wallet account for contribution %s: %s", contribution.id, e)
             return None
     
-    def _check_account_exists(self, contribution) -> bool:
-        try:
-            # active_state = self._get_active_state()
-            return WalletAccountService().filter(
-                contribution=contribution,
-            ).exists()
-        except Exception as e:
-            log.exception("Error checking account existence for contribution %s: %s", contribution.id, e)
-            return False
-    
     def _process_transaction(self, contribution, amount: Decimal, phone_number: str, ref: str, charge, receipt, amount_plus_charge) -> Dict[str, Any]:
         transaction_history = None
         try:
@@ -190,19 +169,15 @@ class InitiatePayment(InterfaceBase):
                     log.exception("Failed to cleanup failed transaction: %s", cleanup_error)
             return self.ERROR_CODES['TRANSACTION_FAILED']
     
-    def post(self, contribution_id, request=None, **kwargs) -> Dict[str, Any]:
+    def post(self, contribution_id=None, request=None, contribution=None, **kwargs) -> Dict[str, Any]:
         try:
-            validation_result = self._validate_inputs(contribution_id, **kwargs)
+            if contribution is None and contribution_id:
+                contribution = ContributionService().get(
+                    id=contribution_id,
+                )
+            validation_result = self._validate_inputs(contribution, **kwargs)
             if validation_result:
                 return validation_result
-            contribution = ContributionService().get(
-                id=contribution_id,
-            )
-            print(contribution)
-            if not contribution:
-                return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-            if not self._check_account_exists(contribution):
-                return self.ERROR_CODES['ACCOUNT_NOT_EXISTS']
             amount = Decimal(str(kwargs["amount"]))
             amount_plus_charge = Decimal(str(kwargs["amount_plus_charge"]))
             phone_number = kwargs["phone_number"].strip()
@@ -211,7 +186,7 @@ class InitiatePayment(InterfaceBase):
         except Exception as e:
             log.exception(
                 "Initiatepayment.post exception for contribution %s: %s",
-                contribution_id,
+                contribution_id or getattr(contribution, 'id', None),
                 e
             )
             return self.ERROR_CODES['TRANSACTION_FAILED']
@@ -311,7 +286,6 @@ class ApprovePaymentTransaction(InterfaceBase):
                         reference=reference,
                         description=description,
                     )
-                    print("Approval result %s" % approval_result)
                     if approval_result is None:
                         raise Exception("Unable to process the approved transaction")
                     log.info(
@@ -41,7 +41,6 @@ class InitiateTopup(InterfaceBase):
     
     @classmethod
     def _get_balance_entry_type(cls) -> Optional[Any]:
-        print(BalanceEntryTypeService().get(name="InitiateTopUp"))
         return BalanceEntryTypeService().get(name="InitiateTopUp")
     
     @classmethod
@@ -79,17 +78,8 @@ class InitiateTopup(InterfaceBase):
         except (ValueError, TypeError, InvalidOperation):
             return False, None
     
-    def _validate_inputs(self, contribution_id: int, **kwargs) -> Optional[Dict[str, Any]]:
-        if not contribution_id:
-            return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-        try:
-            contribution = ContributionService().get(
-                id=contribution_id,
-            )
-            print(contribution)
-            if not contribution:
-                return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-        except Exception:
+    def _validate_inputs(self, contribution, **kwargs) -> Optional[Dict[str, Any]]:
+        if not contribution:
             return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
         amount = kwargs.get("amount")
         is_valid_amount, decimal_amount = self._validate_amount(amount)
@@ -111,22 +101,11 @@ class InitiateTopup(InterfaceBase):
             logger.exception("Error fetching wallet account for contribution %s: %s", contribution.id, e)
             return None
     
-    def _check_account_exists(self, contribution) -> bool:
-        try:
-            return WalletAccountService().filter(
-                contribution=contribution,
-            ).exists()
-        except Exception as e:
-            logger.exception("Error checking account existence for contribution %s: %s", contribution.id, e)
-            return False
-    
     def _process_transaction(self, contribution, amount: Decimal, phone_number: str, ref: str, charge, receipt, amount_plus_charge, actioned_by) -> Dict[str, Any]:
         transaction_history = None
         try:
             with transaction.atomic():
-                print(contribution)
                 account = self._get_wallet_account(contribution)
-                print(account)
                 if not account:
                     return self.ERROR_CODES['ACCOUNT_NOT_EXISTS']
                 balance_entry_type = self._get_balance_entry_type()
@@ -193,19 +172,15 @@ class InitiateTopup(InterfaceBase):
                     logger.exception("Failed to cleanup failed transaction: %s", cleanup_error)
             return self.ERROR_CODES['TRANSACTION_FAILED']
     
-    def post(self, contribution_id, request=None, **kwargs) -> Dict[str, Any]:
+    def post(self, contribution_id=None, request=None, contribution=None, **kwargs) -> Dict[str, Any]:
         try:
-            validation_result = self._validate_inputs(contribution_id, **kwargs)
+            if contribution is None and contribution_id:
+                contribution = ContributionService().get(
+                    id=contribution_id
+                )
+            validation_result = self._validate_inputs(contribution, **kwargs)
             if validation_result:
                 return validation_result
-            contribution = ContributionService().get(
-                id=contribution_id
-            )
-            if not contribution:
-                return self.ERROR_CODES['CONTRIBUTION_NOT_FOUND']
-            print(self._check_account_exists(contribution))
-            if not self._check_account_exists(contribution):
-                return self.ERROR_CODES['ACCOUNT_NOT_EXISTS']
             amount = Decimal(str(kwargs["amount"]))
             amount_plus_charge = Decimal(str(kwargs["amount_plus_charge"]))
             phone_number = kwargs["phone_number"].strip()
@@ -217,7 +192,7 @@ class InitiateTopup(InterfaceBase):
         except Exception as e:
             logger.exception(
                 "InitiateTopup.post exception for contribution %s: %s",
-                contribution_id,
+                contribution_id or getattr(contribution, 'id', None),
                 e
             )
             return self.ERROR_CODES['TRANSACTION_FAILED']
@@ -278,7 +253,6 @@ class ApproveTopupTransaction(InterfaceBase):
         try:
             balance_entry_type = self._get_balance_entry_type()
             transaction_history = self._get_latest_transaction(reference)
-            print(transaction_history)
             if not transaction_history:
                 return {"code": "300.003", "message": "Transaction not found"}
             validation_error = self._validate_transaction_data(transaction_history, balance_entry_type, transaction_history.wallet_account)
@@ -313,7 +287,6 @@ class ApproveTopupTransaction(InterfaceBase):
                         reference=reference,
                         description=description,
                     )
-                    print("Approval Result is :", approval_result)
                     if approval_result is None:
                         raise Exception("Unable to process the approved transaction")
                     log.info(
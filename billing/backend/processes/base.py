@@ -32,9 +32,9 @@ class ProcessorBase(object):
 				rule_profile=rule_profile, state__name="Active").order_by('order')
 			with transaction.atomic():
 				for command in profile_commands:
-					print(command)
+					log.debug('%s running command %s', self.log_name, command)
 					results = self.call_self_method(command.name, **kwargs)
-					print(results)
+					log.debug('%s command %s results: %s', self.log_name, command.name, results)
 					# if not results:
 					# 	raise Exception(
 					# 		'%s Processing error, got results: %s for command: %s' % (
@@ -0,0 +1,43 @@
+"""
+O(1) dispatch for the hot billing endpoints.
+
+Django's URLResolver walks the pattern list on every request; the billing
+paths (especially the Pesaway callbacks) are exact strings hit at high
+rate, so a dict lookup keyed on the full path is enough to route them.
+Unknown paths fall through to the normal resolver.
+"""
+from billing.views import billing_admin, health_check, ready_check
+
+_API_V1_PREFIX = "/api/billing/api/v1/"
+
+ROUTES = {
+    f"{_API_V1_PREFIX}pledge/create/": billing_admin.create_pledge,
+    f"{_API_V1_PREFIX}pledge/clear/": billing_admin.clear_pledge,
+    f"{_API_V1_PREFIX}wallet/balance/": billing_admin.wallet_balance,
+    f"{_API_V1_PREFIX}wallet/mobile-money-transfer/": billing_admin.mobile_money_transfer,
+    f"{_API_V1_PREFIX}wallet/b2c-transfer/": billing_admin.b2c_transfer,
+    f"{_API_V1_PREFIX}wallet/c2b-payment/": billing_admin.c2b_payment,
+    f"{_API_V1_PREFIX}wallet/query-mobile-money-transaction/": billing_admin.query_mobile_money_transaction,
+    f"{_API_V1_PREFIX}callbacks/b2c/": billing_admin.b2c_transfer_callback_url,
+    f"{_API_V1_PREFIX}callbacks/c2b/": billing_admin.c2b_payment_callback_endpoint,
+    "/api/billing/health/": health_check,
+    "/api/billing/ready/": ready_check,
+}
+
+
+class FastRouteMiddleware:
+    """
+    Short-circuits URL resolution for exact-match billing paths.
+
+    Must sit after GatewayControlMiddleware so API key validation and
+    rate limiting still apply; all routed views are csrf_exempt.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        handler = ROUTES.get(request.path_info)
+        if handler is not None:
+            return handler(request)
+        return self.get_response(request)
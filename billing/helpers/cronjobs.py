@@ -1,10 +1,9 @@
 import logging
-from django.conf import settings
 from django.utils import timezone
 from base.backend.service import WalletTransactionService
 from billing.backend.interfaces.payment import ApprovePaymentTransaction
 from billing.backend.interfaces.topup import ApproveTopupTransaction
-from billing.itergrations.pesaway import PesaWayAPIClient
+from billing.itergrations.pesaway import get_pesaway_client
 from billing.models import WalletTransaction
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -50,12 +49,7 @@ class Automate:
         Run the automation tasks.
         """
         try:
-            client = PesaWayAPIClient(
-                client_id=settings.PESAWAY_CLIENT_ID,
-                client_secret=settings.PESAWAY_CLIENT_SECRET,
-                base_url=getattr(settings, 'PESAWAY_BASE_URL', 'https://api.pesaway.com'),
-                timeout=getattr(settings, 'PESAWAY_TIMEOUT', 30)
-            )
+            client = get_pesaway_client()
             transaction_processors = {
                 "topup": ApproveTopupTransaction(),
                 "payment": ApprovePaymentTransaction(),
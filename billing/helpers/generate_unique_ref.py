@@ -1,5 +1,26 @@
+import os
 import random
 import string
+import time
+
+# Crockford base32: no I, L, O, U, so references stay unambiguous.
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def generate_ulid() -> str:
+    """
+    Generate a 26-character ULID-style transaction reference.
+
+    48 bits of millisecond timestamp followed by 80 random bits, encoded
+    in Crockford base32 — time-ordered, lexicographically sortable and
+    collision-safe under burst, unlike a second-resolution epoch suffix.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    chars = []
+    for _ in range(26):
+        chars.append(_ULID_ALPHABET[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
 
 
 class TransactionRefGenerator:
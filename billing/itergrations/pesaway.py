@@ -1,7 +1,9 @@
 import requests
 import json
 import time
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from requests.adapters import HTTPAdapter, Retry
+from typing import Optional, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -44,6 +46,16 @@ class PesaWayAPIClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.token = None
+        # Pooled session: keeps TCP/TLS connections to Pesaway alive across
+        # calls instead of paying the handshake on every request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=getattr(settings, "PESAWAY_MAX_CONNECTIONS", 50),
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _authenticate(self) -> str:
         """Get authentication token"""
@@ -53,9 +65,7 @@ class PesaWayAPIClient:
             "consumer_secret": self.client_secret,
             "grant_type": "client_credentials",
         }
-        response = requests.post(url, json=payload, timeout=self.timeout)
-        print("Auth response status:", response.status_code)
-        print("Auth response text:", response.text)
+        response = self._session.post(url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         data = response.json()
         token = data["data"]["token"]
@@ -65,8 +75,10 @@ class PesaWayAPIClient:
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with valid token"""
-        # Always get fresh token (no caching)
-        self._authenticate()
+        # Reuse the cached token; _make_request re-authenticates on 401,
+        # so each API call costs one outbound request instead of two.
+        if not self.token:
+            self._authenticate()
 
         return {
             "Authorization": f"Bearer {self.token}",
@@ -83,25 +95,17 @@ class PesaWayAPIClient:
         try:
             headers = self._get_headers()
             url = f"{self.base_url}{endpoint}"
-            print("Making request to:", url)
-            print("With payload:", payload)
-            print("Method:", method)
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                response = self._session.get(url, headers=headers, timeout=self.timeout)
             else:
-                response = requests.post(url, json=payload, headers=headers, timeout=self.timeout)
-            print("Response status:", response.status_code)
-            print("Response text:", response.text)
+                response = self._session.post(url, json=payload, headers=headers, timeout=self.timeout)
             if response.status_code == 401:
                 self._authenticate()
                 headers = self._get_headers()
                 if method.upper() == "GET":
-                    response = requests.get(url, headers=headers, timeout=self.timeout)
+                    response = self._session.get(url, headers=headers, timeout=self.timeout)
                 else:
-                    response = requests.post(url, json=payload, headers=headers, timeout=self.timeout)
-                print("Response status:", response.status_code)
-                print("Response text:", response.text)
-            print(response.status_code, response.text)
+                    response = self._session.post(url, json=payload, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return APIResponse(
@@ -165,7 +169,6 @@ class PesaWayAPIClient:
             reason: str,
             results_url: str,
     ) -> APIResponse:
-        print(results_url)
         payload = {
             "ExternalReference": external_reference,
             "Amount": amount,
@@ -185,7 +188,6 @@ class PesaWayAPIClient:
             reason: str,
             results_url: str,
     ) -> APIResponse:
-        print(results_url)
         payload = {
             "ExternalReference": external_reference,
             "Amount": amount,
@@ -194,7 +196,6 @@ class PesaWayAPIClient:
             "Reason": reason,
             "ResultsUrl": settings.PESAWAY_C2B_CALLBACK
         }
-        print("Receiving C2B Payment with payload:", payload)
         return self._make_request("POST", "/api/v1/mobile-money/receive-payment/", payload)
 
     def authorize_transaction(self, transaction_id: str, otp: str) -> APIResponse:
@@ -264,3 +265,18 @@ class PesaWayAPIClient:
         }
         return self._make_request("POST", "/api/v1/airtime/send-airtime/", payload)
 
+
+
+@lru_cache(maxsize=1)
+def get_pesaway_client() -> PesaWayAPIClient:
+    """Return the shared Pesaway API client, built lazily on first use.
+
+    Callbacks, queries and transfers all go through this one pooled
+    client; nothing should construct a per-request session.
+    """
+    return PesaWayAPIClient(
+        client_id=settings.PESAWAY_CLIENT_ID,
+        client_secret=settings.PESAWAY_CLIENT_SECRET,
+        base_url=getattr(settings, "PESAWAY_BASE_URL", "https://api.pesaway.com"),
+        timeout=getattr(settings, "PESAWAY_REQUEST_TIMEOUT", 30),
+    )
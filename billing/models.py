@@ -1,3 +1,5 @@
+import bisect
+
 from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from django.db.models import Sum
@@ -5,6 +7,7 @@ from django.utils import timezone
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from decimal import Decimal, ROUND_UP
+from functools import lru_cache
 import logging
 from typing import Dict, List, Optional
 from enum import Enum
@@ -12,7 +15,6 @@ from enum import Enum
 from django.utils.html import format_html
 
 from base.models import BaseModel, State, EntryType, AccountFieldType, BalanceEntryType
-from billing.helpers.generate_unique_ref import TransactionRefGenerator
 from contributions.models import Contribution
 from users.models import User
 
@@ -158,29 +160,42 @@ CHARGE_TIERS = [
     (150000, 250000, Decimal('0.045')),  # 4.5% for 150,001 - 250,000
 ]
 
-
-def calculate_fair_tiered_charge(amount_kes: float) -> float:
-    """Calculate charge with decimal precision and show breakdown"""
-    amount = Decimal(str(amount_kes))
-    charge_decimal = Decimal('0.0')
-    breakdown = []
+# Precomputed once from CHARGE_TIERS: the cumulative Decimal charge at each
+# tier's lower bound (on top of the 3% base band up to 10,000), so a call
+# is a bisect plus a single marginal multiply instead of walking the table
+# and re-wrapping its bounds in Decimal every time.
+_TIER_LOWERS = tuple(Decimal(lower) for lower, _, _ in CHARGE_TIERS)
+_TIER_UPPERS = tuple(upper for _, upper, _ in CHARGE_TIERS)
+_TIER_RATES = tuple(rate for _, _, rate in CHARGE_TIERS)
+_BASE_BAND_CHARGE = Decimal('10000') * Decimal('0.03')
+_TIER_CUMULATIVE = []
+_acc = _BASE_BAND_CHARGE
+for _lower, _upper, _rate in CHARGE_TIERS:
+    _TIER_CUMULATIVE.append(_acc)
+    _acc += (Decimal(_upper) - Decimal(_lower)) * _rate
+_TIER_CUMULATIVE = tuple(_TIER_CUMULATIVE)
+_TIER_TOTAL_CHARGE = _acc
+
+
+@lru_cache(maxsize=4096)
+def _tiered_charge_cents(cents: int) -> float:
+    """Charge for an amount in integer cents; cached for common denominations."""
+    amount = Decimal(cents) / 100
     if amount <= 10000:
-        charge = (amount * Decimal('0.03')).quantize(Decimal('0.01'), rounding=ROUND_UP)
-        breakdown.append(f"0 - 10,000 KES: 3% charge = {charge} KES")
+        charge = amount * Decimal('0.03')
     else:
-        charge_decimal += Decimal('10000') * Decimal('0.03')
-        breakdown.append(f"0 - 10,000 KES: 3% charge = {charge_decimal} KES")
-        for lower, upper, rate in CHARGE_TIERS:
-            if amount > lower:
-                applicable_amount = min(amount, Decimal(str(upper))) - Decimal(str(lower))
-                tier_charge = applicable_amount * rate
-                charge_decimal += tier_charge
-                breakdown.append(f"{lower + 1:,} - {upper:,} KES: {rate * 100}% charge = {tier_charge:.2f} KES")
-
-        charge = float(charge_decimal.quantize(Decimal('0.01'), rounding=ROUND_UP))
-    breakdown.append(f"Total Charge: {charge} KES")
-    print(breakdown)
-    return charge
+        i = bisect.bisect_left(_TIER_UPPERS, amount)
+        if i == len(_TIER_UPPERS):
+            # Above the top bracket: every tier charges its full band.
+            charge = _TIER_TOTAL_CHARGE
+        else:
+            charge = _TIER_CUMULATIVE[i] + (amount - _TIER_LOWERS[i]) * _TIER_RATES[i]
+    return float(charge.quantize(Decimal('0.01'), rounding=ROUND_UP))
+
+
+def calculate_fair_tiered_charge(amount_kes: float) -> float:
+    """Calculate charge with decimal precision"""
+    return _tiered_charge_cents(int(round(float(amount_kes) * 100)))
 
 def get_charge_rate_for_amount(amount: Decimal) -> Decimal:
     """Get the effective charge rate for a given amount (for logging purposes)"""
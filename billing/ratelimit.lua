@@ -0,0 +1,18 @@
+-- Approximate sliding-window rate limit: two fixed-minute buckets and a
+-- weighted sum, checked and bumped atomically server-side. O(1) memory
+-- per key (two small counters) with no edge-of-window double burst.
+-- KEYS[1] = previous bucket counter, KEYS[2] = current bucket counter
+-- ARGV[1] = limit, ARGV[2] = now_ms, ARGV[3] = window_ms
+local limit = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local elapsed = now % window
+local prev = tonumber(redis.call('GET', KEYS[1]) or '0')
+local curr = tonumber(redis.call('GET', KEYS[2]) or '0')
+local weighted = prev * ((window - elapsed) / window) + curr
+if weighted >= limit then
+    return 0
+end
+redis.call('INCR', KEYS[2])
+redis.call('PEXPIRE', KEYS[2], window * 2)
+return 1
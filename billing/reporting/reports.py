@@ -23,12 +23,13 @@ def unpack_request_data(request) -> Dict[str, Any]:
         content_type = request.META.get('CONTENT_TYPE', '')
         
         if 'application/json' in content_type:
-            body = request.body.decode('utf-8')
-            return json.loads(body) if body else {}
+            # json.loads consumes the body bytes directly; decoding to
+            # str first just copied the payload.
+            return json.loads(request.body) if request.body else {}
         elif request.method == 'GET':
-            return dict(request.GET)
+            return request.GET.dict()
         elif request.method == 'POST':
-            return dict(request.POST)
+            return request.POST.dict()
         return {}
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"Failed to unpack request data: {str(e)}")
@@ -1,31 +1,41 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from celery import shared_task
 from django.utils import timezone
-from django.conf import settings
+
+from django.db import DatabaseError
 
 from base.backend.service import WalletTransactionService
 from billing.backend.interfaces.payment import (
     ApprovePaymentTransaction,
+    InitiatePayment,
     RejectPaymentTransaction,
 )
 from billing.backend.interfaces.topup import (
     ApproveTopupTransaction,
+    InitiateTopup,
     RejectTopupTransaction,
 )
-from billing.itergrations.pesaway import PesaWayAPIClient
+from users.backend.services import UserService
+from billing.itergrations.pesaway import get_pesaway_client
 from billing.views import TransactionStatus
 
 logger = logging.getLogger(__name__)
 
 
-def _get_pesaway_client():
-    """Create a reusable Pesaway API client."""
-    return PesaWayAPIClient(
-        client_id=settings.PESAWAY_CLIENT_ID,
-        client_secret=settings.PESAWAY_CLIENT_SECRET,
-        base_url=getattr(settings, "PESAWAY_BASE_URL", "https://api.pesaway.com"),
-        timeout=getattr(settings, "PESAWAY_TIMEOUT", 30),
+@shared_task(bind=True, autoretry_for=(DatabaseError,), retry_backoff=True)
+def persist_payment(self, contribution_id, payment_data):
+    """Persist an initiated B2C payment off the request's critical path."""
+    return InitiatePayment().post(contribution_id=contribution_id, **payment_data)
+
+
+@shared_task(bind=True, autoretry_for=(DatabaseError,), retry_backoff=True)
+def persist_topup(self, contribution_id, topup_data, actioned_by_id=None):
+    """Persist an initiated C2B topup off the request's critical path."""
+    actioned_by = UserService().get(id=actioned_by_id) if actioned_by_id else None
+    return InitiateTopup().post(
+        contribution_id=contribution_id, actioned_by=actioned_by, **topup_data
     )
 
 
@@ -40,9 +50,29 @@ def _process_pending_transactions(transactions, trx_type, client, approve_handle
     """Shared logic for processing a list of pending transactions."""
     processed_count = 0
 
-    for trx in transactions:
+    transactions = list(transactions)
+    if not transactions:
+        return processed_count
+    # The status queries are independent network calls sharing the pooled
+    # session, so overlap them; DB-side approval/rejection stays in this
+    # thread to keep ORM connection handling simple.
+    def _query_status(trx):
+        try:
+            return client.query_mobile_money_transaction(
+                transaction_reference=trx.receipt_number
+            )
+        except Exception as err:
+            # One failed query must not abort the rest of the batch.
+            logger.error(f"Error querying {trx_type} transaction {trx.id}: {err}", exc_info=True)
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(transactions))) as pool:
+        responses = list(pool.map(_query_status, transactions))
+
+    for trx, response in zip(transactions, responses):
+        if response is None:
+            continue
         try:
-            response = client.query_mobile_money_transaction(transaction_reference=trx.receipt_number)
             data = getattr(response, "data", None) or response.data
 
             result_code = data.get("ResultCode")
@@ -104,7 +134,7 @@ def fetch_pending_payments():
 def check_topup_status():
     """Celery task to check and process pending topup transactions."""
     try:
-        client = _get_pesaway_client()
+        client = get_pesaway_client()
         transactions = fetch_pending_topups()
 
         if not transactions:
@@ -131,7 +161,7 @@ def check_topup_status():
 def check_payment_status():
     """Celery task to check and process pending payment transactions."""
     try:
-        client = _get_pesaway_client()
+        client = get_pesaway_client()
         transactions = fetch_pending_payments()
 
         if not transactions:
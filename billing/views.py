@@ -1,31 +1,106 @@
+import bisect
 import json
+import random
+import os
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
 from decimal import Decimal, ROUND_UP
-from typing import Dict, Any, Optional
-from functools import wraps
-from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Any
+from functools import lru_cache, wraps
 from django.db.models import Q
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import InvalidCacheBackendError, cache, caches
 from django.utils import timezone
 from base.backend.service import StateService, WalletAccountService
 from billing.backend.interfaces.topup import InitiateTopup, ApproveTopupTransaction
 from billing.backend.interfaces.payment import InitiatePayment, ApprovePaymentTransaction
-from billing.helpers.generate_unique_ref import TransactionRefGenerator
+from billing.helpers.generate_unique_ref import generate_ulid
 import logging
-from billing.itergrations.pesaway import PesaWayAPIClient
+from billing.itergrations.pesaway import get_pesaway_client
 from billing.models import Pledge
 from contributions.backend.services import ContributionService
 from users.backend.services import UserService, RoleService
 
 logger = logging.getLogger(__name__)
 
+# Stateless CRUD service; one shared instance saves a construction per
+# request on the payment paths.
+_contribution_service = ContributionService()
+
+# Bound once at import: LOAD_FAST on a module global beats
+# LOAD_GLOBAL + LOAD_ATTR per timing call in the handlers.
+_perf = time.perf_counter
+
+_uuid_pool = deque()
+
+try:
+    # Dedicated Redis-backed alias so limits are shared across workers;
+    # falls back to the default cache where the alias is not configured.
+    _limit_cache = caches['ratelimit']
+except InvalidCacheBackendError:
+    _limit_cache = cache
+
+
+def _now_iso() -> str:
+    """ISO-8601 UTC timestamp, skipping Django's lazy timezone machinery."""
+    return datetime.now(dt_timezone.utc).isoformat()
+
+
+def _refill_uuid_pool():
+    blob = os.urandom(16 * 256)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=blob[i:i + 16], version=4))
+        for i in range(0, len(blob), 16)
+    )
+
+
+def _next_request_id() -> str:
+    """Random v4 UUID string from a batched urandom pool.
+
+    uuid4() costs a syscall per call; one os.urandom read here covers
+    256 response ids. Concurrent refills are harmless (both threads top
+    the pool up), and a pop that loses the race to the last entry just
+    refills and retries instead of propagating IndexError.
+    """
+    while True:
+        if not _uuid_pool:
+            _refill_uuid_pool()
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            continue
+
+
+def _log_request_id() -> str:
+    """Cheap time-based correlation id for log lines.
+
+    Log ids only need to be unique enough to grep a request's lines
+    together; a nanosecond timestamp in hex does that without the
+    entropy cost of a UUID.
+    """
+    return f"{time.time_ns():x}"
+
+
+class CompactJsonResponse(JsonResponse):
+    """JsonResponse serialized with compact separators.
+
+    orjson/ujson are not dependencies of this tree, so the output-path
+    win available is dropping the ", "/": " padding — fewer bytes on
+    the wire and a slightly cheaper dumps for every API response.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('json_dumps_params', {'separators': (',', ':')})
+        super().__init__(data, **kwargs)
+
 
 class ErrorCodes:
     SUCCESS = "200.001"
@@ -40,6 +115,74 @@ class TransactionStatus:
     FAILED = 1
     PENDING = 2
 
+
+@dataclass(slots=True)
+class C2BPaymentRequest:
+    """c2b_payment request body decoded in a single pass into typed fields."""
+    amount: float
+    phone_number: str
+    contribution: str
+    network: str = "MPESA"
+    full_name: str = "Anonymous User"
+
+    @classmethod
+    def from_request(cls, request) -> "C2BPaymentRequest":
+        # Reuse the dict the validation decorator already parsed, if any.
+        data = getattr(request, '_unpacked_data', None)
+        if data is None:
+            if 'application/json' in request.META.get('CONTENT_TYPE', ''):
+                data = json.loads(request.body) if request.body else {}
+            else:
+                data = request.POST
+        return cls(
+            amount=float(data["amount"]),
+            phone_number=str(data["phone_number"]),
+            contribution=str(data["contribution"]),
+            network=str(data.get("network") or "MPESA"),
+            full_name=str(data.get("full_name") or "Anonymous User").strip(),
+        )
+
+
+@dataclass(slots=True)
+class MobileMoneyTransferRequest:
+    """mobile_money_transfer request body decoded in a single typed pass."""
+    amount: float
+    currency: str
+    recipient_number: str
+    reference: str
+
+    @classmethod
+    def from_request(cls, request) -> "MobileMoneyTransferRequest":
+        # Reuse the dict the validation decorator already parsed, if any.
+        data = getattr(request, '_unpacked_data', None)
+        if data is None:
+            if 'application/json' in request.META.get('CONTENT_TYPE', ''):
+                data = json.loads(request.body) if request.body else {}
+            else:
+                data = request.POST
+        return cls(
+            amount=float(data["amount"]),
+            currency=str(data["currency"]),
+            recipient_number=str(data["recipient_number"]),
+            reference=str(data["reference"]),
+        )
+
+
+# Pesaway withdrawal charge tiers (KES): flat fee per amount bracket.
+# Amounts are 2dp KES, so the tier table is precomputed once as floats
+# and the per-request path does no Decimal construction at all.
+_WITHDRAWAL_TIERS = (
+    (1.0, 1500.0, 12.0),
+    (1501.0, 5000.0, 19.0),
+    (5001.0, 10000.0, 24.0),
+    (10001.0, 20000.0, 33.0),
+    (20001.0, 250000.0, 39.0),
+)
+_WITHDRAWAL_TIER_LOWERS = tuple(tier[0] for tier in _WITHDRAWAL_TIERS)
+_WITHDRAWAL_TIER_UPPERS = tuple(tier[1] for tier in _WITHDRAWAL_TIERS)
+_WITHDRAWAL_TIER_FEES = tuple(tier[2] for tier in _WITHDRAWAL_TIERS)
+
+
 def check_pesaway_withdrawal_charges(amount_kes: float, available=None):
     """
     Check if a withdrawal can be made considering Pesaway tiered charges.
@@ -58,38 +201,28 @@ def check_pesaway_withdrawal_charges(amount_kes: float, available=None):
             2. withdrawable > 0
             3. (amount + charge) <= available
     """
-    amount = Decimal(str(amount_kes))
-    if amount < Decimal(10) or amount > Decimal(250000):
+    amount = float(amount_kes)
+    if amount < 10 or amount > 250000:
         return {
             "can_withdraw": False,
             "charge": 0,
             "withdrawable": 0,
         }
-    available = Decimal(str(available)) if available else Decimal("0")
-    tiers = [
-        (Decimal("1"), Decimal("1500"), Decimal("12")),
-        (Decimal("1501"), Decimal("5000"), Decimal("19")),
-        (Decimal("5001"), Decimal("10000"), Decimal("24")),
-        (Decimal("10001"), Decimal("20000"), Decimal("33")),
-        (Decimal("20001"), Decimal("250000"), Decimal("39")),
-    ]
-    charge = Decimal("0")
-    for min_limit, max_limit, fee in tiers:
-        if min_limit <= amount <= max_limit:
-            charge = fee
-            break
-    if charge == 0:
-        charge = tiers[-1][2]
-    withdrawable = (amount - charge).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    available = float(available) if available else 0.0
+    i = bisect.bisect_left(_WITHDRAWAL_TIER_UPPERS, amount)
+    # Amounts in the gap between brackets (e.g. 1500.50) keep falling
+    # through to the top-tier fee, exactly as the linear scan did.
+    charge = _WITHDRAWAL_TIER_FEES[i] if amount >= _WITHDRAWAL_TIER_LOWERS[i] else _WITHDRAWAL_TIER_FEES[-1]
+    withdrawable = round(amount - charge, 2)
     can_withdraw = (
         amount > charge and
         withdrawable > 0 and
         (amount + charge) <= available
     )
     to_withdraw = round(available - charge, 2)
-    print(
-        f"[DEBUG] Amount: {amount}, Charge: {charge}, Total Required: {amount + charge}, "
-        f"Available: {available}, Withdrawable: {withdrawable}, Allowed: {can_withdraw}"
+    logger.debug(
+        "Withdrawal check: amount=%s charge=%s required=%s available=%s withdrawable=%s allowed=%s",
+        amount, charge, amount + charge, available, withdrawable, can_withdraw,
     )
     return {
         "can_withdraw": can_withdraw,
@@ -97,33 +230,182 @@ def check_pesaway_withdrawal_charges(amount_kes: float, available=None):
         "withdrawable": to_withdraw,
     }
 
+@lru_cache(maxsize=4096)
+def _fair_charge_cents(cents: int) -> float:
+    """Charge for an amount in integer cents; cached for common denominations."""
+    if cents > 50000:
+        return 15.0
+    return float((Decimal(cents) * Decimal('0.03') / 100).quantize(Decimal('0.01'), rounding=ROUND_UP))
+
+
 def calculate_fair_charge(amount_kes: float) -> float:
     """Calculate a 3% charge, minimum 15 KES if amount > 500"""
-    amount = Decimal(amount_kes)
-    if amount > 500:
-        return 15.0
-    return float((amount * Decimal('0.03')).quantize(Decimal('0.01'), rounding=ROUND_UP))
+    return _fair_charge_cents(int(round(float(amount_kes) * 100)))
+
+
+# State/Role rows are static reference data; remember their ids (not the
+# instances, which would pin stale ORM objects) after the first lookup.
+_state_id_cache = {}
+_role_id_cache = {}
+
+
+def _state_id_by_name(name: str):
+    """Primary key of a State reference row, cached after first lookup."""
+    state_id = _state_id_cache.get(name)
+    if state_id is None:
+        state = StateService().get(name=name)
+        if state is None:
+            return None
+        _state_id_cache[name] = state_id = state.id
+    return state_id
+
+
+def _role_id_by_name(name: str):
+    """Primary key of a Role reference row, cached after first lookup."""
+    role_id = _role_id_cache.get(name)
+    if role_id is None:
+        role = RoleService().get(name=name)
+        if role is None:
+            return None
+        _role_id_cache[name] = role_id = role.id
+    return role_id
+
+
+class CircuitBreaker:
+    """
+    Minimal in-process circuit breaker for outbound Pesaway calls.
+
+    Opens after `failure_threshold` consecutive failures and stays open for
+    `reset_timeout` seconds, after which the next call is let through as a
+    probe. Per-process state only, which is enough to stop a Pesaway outage
+    from serially timing out every request a worker handles.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: int):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at = None
+
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        if _perf() - self.opened_at >= self.reset_timeout:
+            # Half-open: let the next call through as a probe.
+            self.opened_at = None
+            return False
+        return True
+
+    def record_success(self):
+        self.failure_count = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failure_count += 1
+        if self.failure_count >= self.failure_threshold:
+            self.opened_at = _perf()
+
+
+_balance_breaker = CircuitBreaker(
+    failure_threshold=getattr(settings, 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5),
+    reset_timeout=getattr(settings, 'CIRCUIT_BREAKER_TIMEOUT', 60),
+)
+
+
+with open(os.path.join(os.path.dirname(__file__), 'ratelimit.lua')) as _f:
+    _RATELIMIT_LUA = _f.read()
+_ratelimit_script_sha = None
+_redis_unavailable = False
+
+
+def _rolling_window_allowed(key: str, limit: int, window_ms: int = 60000):
+    """
+    Atomic sliding-window check against the raw Redis client.
+
+    The Lua script weighs the previous minute's counter against the
+    elapsed fraction of the current one (two O(1) counters per key), so
+    the limit is shared across workers, costs one round-trip, and does
+    not suffer the fixed-window 2x boundary burst. Returns True/False,
+    or None when the cache backend has no raw Redis connection
+    (dev/test).
+    """
+    global _ratelimit_script_sha, _redis_unavailable
+    if _redis_unavailable:
+        return None
+    try:
+        from django_redis import get_redis_connection
+        try:
+            conn = get_redis_connection('ratelimit')
+        except Exception:
+            conn = get_redis_connection('default')
+        if _ratelimit_script_sha is None:
+            _ratelimit_script_sha = conn.script_load(_RATELIMIT_LUA)
+        now_ms = int(time.time() * 1000)
+        bucket = now_ms // window_ms
+        args = (2, f"{key}:{bucket - 1}", f"{key}:{bucket}", limit, now_ms, window_ms)
+        try:
+            return bool(conn.evalsha(_ratelimit_script_sha, *args))
+        except Exception:
+            # NOSCRIPT after a Redis restart: reload once and retry.
+            _ratelimit_script_sha = conn.script_load(_RATELIMIT_LUA)
+            return bool(conn.evalsha(_ratelimit_script_sha, *args))
+    except ImportError:
+        # django_redis isn't installed; don't retry the import per request.
+        _redis_unavailable = True
+        return None
+    except Exception:
+        return None
+
+
+def _rate_limited_response(retry_after: int):
+    """429 with Retry-After so well-behaved clients back off instead of
+    hammering; a little jitter spreads the retry herd."""
+    response = JsonResponse({
+        "code": ErrorCodes.RATE_LIMIT_EXCEEDED,
+        "message": "Rate limit exceeded. Please try again later."
+    }, status=429)
+    # X-RateLimit-* stays with GatewayControlMiddleware, which rewrites
+    # those headers on every response; Retry-After is ours alone.
+    response['Retry-After'] = str(retry_after + random.randint(0, 5))
+    return response
 
 
 def rate_limit(requests_per_minute: int = 1000):
     """Simple rate limiting decorator"""
 
     def decorator(func):
+        # Formatted once at decoration; the per-request cost is one concat.
+        key_prefix = f"rate_limit:{func.__name__}:"
+
         @wraps(func)
         def wrapper(self, request, *args, **kwargs):
-            client_id = request.META.get('HTTP_X_FORWARDED_FOR',
-                                         request.META.get('REMOTE_ADDR', 'unknown'))
-            rate_limit_key = f"rate_limit:{func.__name__}:{client_id}"
-            current_requests = cache.get(rate_limit_key, 0)
+            # GatewayControlMiddleware already resolved the client IP;
+            # only fall back to the META chain when it is absent.
+            if (client_id := getattr(request, 'client_ip', None)) is None:
+                client_id = request.META.get('HTTP_X_FORWARDED_FOR',
+                                             request.META.get('REMOTE_ADDR', 'unknown'))
+            rate_limit_key = key_prefix + client_id
+            allowed = _rolling_window_allowed(rate_limit_key, requests_per_minute)
+            if allowed is not None:
+                if not allowed:
+                    logger.warning(f"Rate limit exceeded for {client_id}")
+                    return _rate_limited_response(60 - int(time.time()) % 60)
+                return func(self, request, *args, **kwargs)
+            # Fixed-window fallback when no raw Redis client is available:
+            # incr() first keeps the warm path to a single atomic backend
+            # round-trip; only a missing/expired key pays the add() to
+            # start a fresh window with the 60s TTL.
+            try:
+                current_requests = _limit_cache.incr(rate_limit_key)
+            except ValueError:
+                _limit_cache.add(rate_limit_key, 1, 60)
+                current_requests = 1
 
-            if current_requests >= requests_per_minute:
+            if current_requests > requests_per_minute:
                 logger.warning(f"Rate limit exceeded for {client_id}")
-                return JsonResponse({
-                    "code": ErrorCodes.RATE_LIMIT_EXCEEDED,
-                    "message": "Rate limit exceeded. Please try again later."
-                }, status=429)
+                ttl = getattr(_limit_cache, 'ttl', lambda _key: None)(rate_limit_key)
+                return _rate_limited_response(int(ttl) if ttl else 60)
 
-            cache.set(rate_limit_key, current_requests + 1, 60)
             return func(self, request, *args, **kwargs)
 
         return wrapper
@@ -135,16 +417,21 @@ def validate_request_data(required_fields: list):
     """Request validation decorator"""
 
     def decorator(func):
+        # Snapshot once at decoration time; the happy path below then
+        # allocates nothing per request.
+        required = tuple(required_fields)
+
         @wraps(func)
         def wrapper(self, request, *args, **kwargs):
             try:
                 data = self.unpack_request_data(request)
-                missing_fields = [field for field in required_fields if not data.get(field)]
-                if missing_fields:
-                    return JsonResponse({
-                        "code": ErrorCodes.VALIDATION_ERROR,
-                        "message": f"Missing required fields: {', '.join(missing_fields)}"
-                    }, status=400)
+                for field in required:
+                    if not data.get(field):
+                        missing_fields = [f for f in required if not data.get(f)]
+                        return JsonResponse({
+                            "code": ErrorCodes.VALIDATION_ERROR,
+                            "message": f"Missing required fields: {', '.join(missing_fields)}"
+                        }, status=400)
                 return func(self, request, *args, **kwargs)
             except json.JSONDecodeError:
                 return JsonResponse({
@@ -164,81 +451,134 @@ def validate_request_data(required_fields: list):
 
 
 class BillingAdmin(View):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.client = PesaWayAPIClient(
-            client_id=settings.PESAWAY_CLIENT_ID,
-            client_secret=settings.PESAWAY_CLIENT_SECRET,
-            base_url=getattr(settings, 'PESAWAY_BASE_URL', 'https://api.pesaway.com'),
-            timeout=getattr(settings, 'PESAWAY_TIMEOUT', 30)
-        )
+    # Pesaway retries callbacks; one SETNX-style gate per TransactionID
+    # makes the duplicate path a single cache round-trip instead of a
+    # repeated (double-crediting) DB transaction.
+    IDEMPOTENCY_TTL = 86400
+
+    BALANCE_CACHE_KEY = "wallet_balance:current"
+    # Short enough that callers never see a stale balance in practice,
+    # long enough to collapse a burst of queries into one outbound call.
+    BALANCE_CACHE_TTL = 2
+    BALANCE_LAST_GOOD_KEY = "wallet_balance:last_good"
+
+    @property
+    def client(self):
+        """Shared Pesaway API client, created lazily on first use."""
+        return get_pesaway_client()
+
+    def _claim_idempotency(self, kind: str, receipt: str):
+        """Claim first-processing rights for a callback receipt.
+
+        Returns (claimed, replay_response): on a duplicate delivery the
+        previously stored payload is replayed when available.
+        """
+        key = f"idem:{kind}:{receipt}"
+        if cache.add(key, 1, self.IDEMPOTENCY_TTL):
+            return key, None
+        payload = cache.get(f"{key}:response")
+        if payload is None:
+            payload = {"status": "DUPLICATE", "receipt": receipt}
+        return None, self.create_success_response(payload)
 
     def unpack_request_data(self, request) -> Dict[str, Any]:
-        """Extract data from request"""
+        """Extract data from request, parsing the body at most once per request"""
+        cached = getattr(request, '_unpacked_data', None)
+        if cached is not None:
+            return cached
+        # GatewayControlMiddleware already ran get_request_data over this
+        # request; reuse its dict instead of parsing the body again.
+        gateway_data = getattr(request, 'data', None)
+        if isinstance(gateway_data, dict) and gateway_data:
+            request._unpacked_data = gateway_data
+            return gateway_data
         try:
             content_type = request.META.get('CONTENT_TYPE', '')
 
             if 'application/json' in content_type:
-                body = request.body.decode('utf-8')
-                return json.loads(body) if body else {}
+                # json.loads takes the raw bytes directly; decoding to str
+                # first just paid for an extra copy of the body.
+                data = json.loads(request.body) if request.body else {}
             elif request.method == 'GET':
-                return dict(request.GET)
+                # QueryDict.dict() yields scalar values (dict() on a
+                # QueryDict produces per-key lists) in one flat copy.
+                data = request.GET.dict()
             elif request.method == 'POST':
-                return dict(request.POST)
-            return {}
+                data = request.POST.dict()
+            else:
+                data = {}
+            request._unpacked_data = data
+            return data
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Failed to unpack request data: {str(e)}")
             raise
 
-    def create_error_response(self, error_code: str, message, status: int = 500, **extra_data):
+    def create_error_response(self, error_code: str, message, status: int = 500, request_id=None, **extra_data):
         """Create standardized error response"""
-        response_data = {
+        return CompactJsonResponse({
             "code": error_code,
             "message": message,
-            "timestamp": timezone.now().isoformat(),
-            "request_id": str(uuid.uuid4())
-        }
-        response_data.update(extra_data)
-        return JsonResponse(response_data, status=status)
+            "timestamp": _now_iso(),
+            "request_id": request_id or _next_request_id(),
+            **extra_data
+        }, status=status)
 
-    def create_success_response(self, data: Dict[str, Any], **extra_data):
+    def create_success_response(self, data: Dict[str, Any], request_id=None, **extra_data):
         """Create standardized success response"""
-        response_data = {
+        return CompactJsonResponse({
             "code": ErrorCodes.SUCCESS,
-            "timestamp": timezone.now().isoformat(),
-            "request_id": str(uuid.uuid4()),
-            "data": data
-        }
-        response_data.update(extra_data)
-        return JsonResponse(response_data)
+            "timestamp": _now_iso(),
+            "request_id": request_id or _next_request_id(),
+            "data": data,
+            **extra_data
+        })
 
     @method_decorator(csrf_exempt)
     @method_decorator(require_http_methods(["GET"]))
     @rate_limit(500)
     def wallet_balance(self, request):
         """Get wallet balance"""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
 
         try:
             logger.info(f"Wallet balance request started: {request_id}")
+            cached = cache.get(self.BALANCE_CACHE_KEY)
+            if cached is not None:
+                return self.create_success_response(cached, request_id=request_id)
+            if _balance_breaker.is_open():
+                last_good = cache.get(self.BALANCE_LAST_GOOD_KEY)
+                if last_good is not None:
+                    return self.create_success_response(last_good, stale=True, request_id=request_id)
+                return self.create_error_response(
+                    ErrorCodes.INTERNAL_ERROR,
+                    "Balance service temporarily unavailable",
+                    status=503
+                , request_id=request_id)
             response = self.client.get_account_balance()
             if response.success:
-                return self.create_success_response(response.data)
+                _balance_breaker.record_success()
+                cache.set(self.BALANCE_CACHE_KEY, response.data, self.BALANCE_CACHE_TTL)
+                cache.set(self.BALANCE_LAST_GOOD_KEY, response.data, 3600)
+                return self.create_success_response(response.data, request_id=request_id)
             else:
+                _balance_breaker.record_failure()
+                last_good = cache.get(self.BALANCE_LAST_GOOD_KEY)
+                if last_good is not None:
+                    return self.create_success_response(last_good, stale=True, request_id=request_id)
                 return self.create_error_response(
                     ErrorCodes.INTERNAL_ERROR,
                     "Failed to retrieve balance",
                     error_details=response.error
-                )
+                , request_id=request_id)
         except Exception as e:
             logger.exception(f"Error fetching wallet balance: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Wallet balance retrieval failed"
-            )
+            , request_id=request_id)
         finally:
-            duration = time.time() - start_time
+            duration = _perf() - start_time
             logger.info(f"Wallet balance request completed: {request_id} - {duration}s")
 
     @method_decorator(csrf_exempt)
@@ -247,57 +587,49 @@ class BillingAdmin(View):
     @validate_request_data(['amount', 'currency', 'recipient_number', 'reference'])
     def mobile_money_transfer(self, request):
         """Mobile money transfer"""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
 
         try:
-            data = self.unpack_request_data(request)
             logger.info(f"Mobile money transfer initiated: {request_id}")
             try:
-                amount = float(data.get('amount'))
-                if amount <= 0:
-                    return self.create_error_response(
-                        ErrorCodes.VALIDATION_ERROR,
-                        "Amount must be greater than zero",
-                        status=400
-                    )
+                req = MobileMoneyTransferRequest.from_request(request)
             except (ValueError, TypeError):
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Invalid amount format",
                     status=400
-                )
-
-            if not data.get('reference'):
+                , request_id=request_id)
+            if req.amount <= 0:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
-                    "Reference is required",
+                    "Amount must be greater than zero",
                     status=400
-                )
+                , request_id=request_id)
             response = self.client.send_mobile_money(
-                amount=amount,
-                currency=data.get('currency'),
-                recipient_number=data.get('recipient_number'),
-                reference=data.get('reference')
+                amount=req.amount,
+                currency=req.currency,
+                recipient_number=req.recipient_number,
+                reference=req.reference
             )
 
             if response.success:
                 logger.info(f"Mobile money transfer successful: {request_id}")
-                return self.create_success_response(response.data)
+                return self.create_success_response(response.data, request_id=request_id)
             else:
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     "Transfer could not be completed",
                     error_details=response.error
-                )
+                , request_id=request_id)
         except Exception as e:
             logger.exception(f"Mobile money transfer failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Transfer processing failed"
-            )
+            , request_id=request_id)
         finally:
-            duration = time.time() - start_time
+            duration = _perf() - start_time
             logger.info(f"Mobile money transfer completed: {request_id} - {duration}s")
 
     @method_decorator(csrf_exempt)
@@ -306,54 +638,55 @@ class BillingAdmin(View):
     @validate_request_data(['amount', 'phone_number', 'contribution'])
     def b2c_transfer(self, request):
         """B2C transfer (business to customer)"""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
         try:
-            data = self.unpack_request_data(request)
-            base_reference = TransactionRefGenerator().generate()
-            reference = f"{base_reference}{int(time.time())}"
-            contribution = ContributionService().get(alias=data.get('contribution'))
-            print(request.user)
+            # Copy before mutating below: the parsed dict may be the same
+            # object the gateway middleware logs as request_data.
+            data = dict(self.unpack_request_data(request))
+            reference = generate_ulid()
+            contribution = _contribution_service.filter(
+                alias=data.get('contribution')
+            ).select_related('creator').first()
             if request.user != contribution.creator:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Withdrawer must be Creator",
                     status=400
-                )
+                , request_id=request_id)
             network = data.get('network', "MPESA")
-            amount = data.get("amount", 0)
+            # Parse the amount exactly once and reuse it everywhere below.
+            try:
+                base_amount = float(data.get('amount') or 0)
+            except (ValueError, TypeError):
+                return self.create_error_response(
+                    ErrorCodes.VALIDATION_ERROR,
+                    "Invalid amount format",
+                    status=400
+                , request_id=request_id)
             wallet = WalletAccountService().get(contribution=contribution)
             if not wallet:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Insufficient Funds",
                     status=400
-                )
+                , request_id=request_id)
 
-            can_withdraw = check_pesaway_withdrawal_charges(amount_kes=float(amount), available=wallet.available)
-            print(can_withdraw)
+            can_withdraw = check_pesaway_withdrawal_charges(amount_kes=base_amount, available=wallet.available)
             if isinstance(can_withdraw, dict) and not can_withdraw.get("can_withdraw", False):
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     message=can_withdraw,
                     status=400
-                )
-            try:
-                base_amount = float(data.get('amount'))
-                if base_amount <= 0:
-                    return self.create_error_response(
-                        ErrorCodes.VALIDATION_ERROR,
-                        "Amount must be greater than zero",
-                        status=400
-                    )
-                charge = can_withdraw.get("charge")
-                total_amount = round(float(base_amount), 2) + round(float(charge), 2)
-            except (ValueError, TypeError):
+                , request_id=request_id)
+            if base_amount <= 0:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
-                    "Invalid amount format",
+                    "Amount must be greater than zero",
                     status=400
-                )
+                , request_id=request_id)
+            charge = can_withdraw.get("charge")
+            total_amount = round(base_amount + charge, 2)
 
             logger.info(f"B2C transfer initiated: {request_id} - {reference} - {total_amount}")
             response = self.client.send_b2c_payment(
@@ -361,7 +694,7 @@ class BillingAdmin(View):
                 amount=base_amount,
                 network=network,
                 phone_number=data.get('phone_number'),
-                reason=f"Withdrawal from contribution on {timezone.now()}",
+                reason=f"Withdrawal from contribution on {_now_iso()}",
                 results_url=settings.PESAWAY_B2C_CALLBACK
             )
             if not response.success or (response.data and response.data.get('code') != ErrorCodes.SUCCESS):
@@ -369,15 +702,24 @@ class BillingAdmin(View):
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     "Transaction could not be initiated"
-                )
+                , request_id=request_id)
             receipt = response.data.get('TransactionID')
             data['receipt'] = receipt
             data['amount'] = base_amount
             data['amount_plus_charge'] = total_amount
-            payment_data = {**data, 'ref': reference, 'charge': round(float(charge), 2)}
-            payment = InitiatePayment().post(
-                contribution_id=str(contribution.id), **payment_data
-            )
+            payment_data = {**data, 'ref': reference, 'charge': round(charge, 2)}
+            # The raw body carries the contribution alias under the same key
+            # as the interface's contribution kwarg; drop it so the hydrated
+            # object (or the task's contribution_id) wins.
+            payment_data.pop('contribution', None)
+            if settings.QUEUE_BILLING_PERSISTENCE:
+                from billing.tasks import persist_payment
+                persist_payment.delay(str(contribution.id), payment_data)
+                payment = {}
+            else:
+                payment = InitiatePayment().post(
+                    contribution=contribution, **payment_data
+                )
             logger.info(f"B2C transfer processing completed: {request_id}")
             return self.create_success_response({
                 "transaction_reference": reference,
@@ -386,62 +728,75 @@ class BillingAdmin(View):
                 "total_amount": total_amount,
                 "status": "PENDING",
                 **payment
-            })
+            }, request_id=request_id)
 
         except Exception as e:
             logger.exception(f"B2C transfer failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "B2C transfer processing failed"
-            )
+            , request_id=request_id)
         finally:
-            duration = time.time() - start_time
+            duration = _perf() - start_time
             logger.info(f"B2C transfer request completed: {request_id} - {duration}s")
 
     @method_decorator(csrf_exempt)
     def b2c_transfer_callback_url(self, request):
         """B2C callback handler"""
-        request_id = str(uuid.uuid4())
+        request_id = _log_request_id()
         try:
             data = self.unpack_request_data(request)
-            print(data)
             logger.info(f"B2C callback received: {request_id}")
             result_code = data.get("ResultCode")
             result_desc = data.get("ResultDesc", "")
             if result_code == TransactionStatus.SUCCESS and "successfully" in result_desc.lower():
                 reference = data.get("OriginatorReference")
-                print(reference)
                 receipt = data.get("TransactionID")
                 if not reference or not receipt:
                     logger.error(f"Missing transaction details in callback: {request_id}")
                     return self.create_error_response(
                         ErrorCodes.VALIDATION_ERROR,
                         "Missing transaction reference or receipt"
+                    , request_id=request_id)
+                idem_key, replay = self._claim_idempotency("b2c", receipt)
+                if replay is not None:
+                    logger.info(f"Duplicate B2C callback replayed: {request_id} - {receipt}")
+                    return replay
+                try:
+                    approval_result = ApprovePaymentTransaction().post(
+                        request, reference=reference, receipt=receipt
                     )
-                approval_result = ApprovePaymentTransaction().post(
-                    request, reference=reference, receipt=receipt
-                )
+                except Exception:
+                    # Release the claim so a legitimate retry can process.
+                    cache.delete(idem_key)
+                    raise
                 logger.info(f"B2C transaction approved: {request_id}")
-                return self.create_success_response({
+                payload = {
                     "status": "APPROVED",
                     "reference": reference,
                     "receipt": receipt,
                     **approval_result
-                })
+                }
+                if str(approval_result.get("code", "")).startswith("200"):
+                    cache.set(f"{idem_key}:response", payload, self.IDEMPOTENCY_TTL)
+                else:
+                    # Approval didn't land; let a retry attempt it again.
+                    cache.delete(idem_key)
+                return self.create_success_response(payload, request_id=request_id)
             else:
                 logger.warning(f"B2C transaction failed: {request_id} - {result_desc}")
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     f"Transaction failed: {result_desc}",
                     result_code=result_code
-                )
+                , request_id=request_id)
 
         except Exception as e:
             logger.exception(f"B2C callback processing failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Callback processing failed"
-            )
+            , request_id=request_id)
 
     @method_decorator(csrf_exempt)
     @method_decorator(require_http_methods(["POST"]))
@@ -449,53 +804,72 @@ class BillingAdmin(View):
     @validate_request_data(['amount', 'phone_number', 'contribution'])
     def c2b_payment(self, request):
         """C2B payment (customer to business)"""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
         try:
-            data = self.unpack_request_data(request)
-            print(data)
-            contribution = ContributionService().get(~Q(status="INACTIVE"),alias=data.get('contribution'))
+            req = C2BPaymentRequest.from_request(request)
+            contribution = _contribution_service.get(~Q(status="INACTIVE"), alias=req.contribution)
             if not contribution:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Contribution is expired or not found",
                     status=404
-                )
-            base_reference = TransactionRefGenerator().generate()
-            reference = f"{base_reference}{int(time.time())}"
-            base_amount = float(data.get('amount'))
-            network = data.get('network', "MPESA")
+                , request_id=request_id)
+            reference = generate_ulid()
+            base_amount = req.amount
             charge = calculate_fair_charge(base_amount)
             total_amount = base_amount + charge
             logger.info(f"C2B payment initiated: {request_id} - {reference}")
             response = self.client.receive_c2b_payment(
                 external_reference=reference,
                 amount=base_amount,
-                phone_number=data.get('phone_number'),
-                network=network,
-                reason=f"Contribution on {timezone.now()}",
+                phone_number=req.phone_number,
+                network=req.network,
+                reason=f"Contribution on {_now_iso()}",
                 results_url=settings.PESAWAY_C2B_CALLBACK
             )
-            print(response)
             if not response.success or response.data.get('code') != ErrorCodes.SUCCESS:
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     "Payment could not be initiated"
-                )
-            actioned_by = UserService().filter(phone_number=data.get('phone_number')).first()
-            if not actioned_by:
-                names = data.get('full_name', 'Anonymous User').strip()
-                parts = names.split(maxsplit=1)
-                first_name = parts[0] if parts else "Anonymous"
-                last_name = parts[1] if len(parts) > 1 else "User"
-                role = RoleService().get(name="USER")
-                actioned_by = UserService().create(username=data.get('phone_number'), phone_number=data.get('phone_number'), first_name=first_name, last_name=last_name, role=role)
+                , request_id=request_id)
+            parts = req.full_name.split(maxsplit=1)
+            actioned_by, _ = UserService().get_or_create(
+                phone_number=req.phone_number,
+                defaults={
+                    'username': req.phone_number,
+                    'first_name': parts[0] if parts else "Anonymous",
+                    'last_name': parts[1] if len(parts) > 1 else "User",
+                    'role_id': _role_id_by_name("USER"),
+                },
+            )
+            if actioned_by is None:
+                # Duplicate phone numbers predate the unique-less column;
+                # fall back to the first match as the old lookup did.
+                actioned_by = UserService().filter(phone_number=req.phone_number).first()
             amount_minus_charge = base_amount - charge
             receipt = response.data.get('TransactionID')
-            topup_data = {**data, 'ref': reference, 'charge': charge, "amount": amount_minus_charge, "amount_plus_charge": base_amount,'receipt': receipt, 'actioned_by': actioned_by}
-            topup_result = InitiateTopup().post(
-                contribution_id=str(contribution.id), **topup_data
-            )
+            topup_data = {
+                'phone_number': req.phone_number,
+                'ref': reference,
+                'charge': charge,
+                'amount': amount_minus_charge,
+                'amount_plus_charge': base_amount,
+                'receipt': receipt,
+            }
+            if settings.QUEUE_BILLING_PERSISTENCE:
+                from billing.tasks import persist_topup
+                persist_topup.delay(
+                    str(contribution.id), topup_data,
+                    actioned_by_id=str(actioned_by.id) if actioned_by else None
+                )
+                topup_result = {}
+            else:
+                topup_result = InitiateTopup().post(
+                    contribution=contribution,
+                    actioned_by=actioned_by,
+                    **topup_data,
+                )
             return self.create_success_response({
                 "transaction_reference": reference,
                 "amount": base_amount,
@@ -503,15 +877,15 @@ class BillingAdmin(View):
                 "amount_minus_charge": amount_minus_charge,
                 "status": "PENDING",
                 **topup_result
-            })
+            }, request_id=request_id)
         except Exception as e:
             logger.exception(f"C2B payment failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "C2B payment processing failed"
-            )
+            , request_id=request_id)
         finally:
-            duration = time.time() - start_time
+            duration = _perf() - start_time
             logger.info(f"C2B payment completed: {request_id} - {duration}s")
 
     @method_decorator(csrf_exempt)
@@ -520,8 +894,8 @@ class BillingAdmin(View):
     @validate_request_data(['pledger_contact', 'pledger_name', 'amount', 'planned_clear_date', 'contribution'])
     def create_pledge(self, request):
         """Endpoint: Create a pledge (Customer to Business)."""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
         try:
             data = self.unpack_request_data(request)
             logger.debug(f"Incoming pledge request {request_id}: {data}")
@@ -532,23 +906,23 @@ class BillingAdmin(View):
                         ErrorCodes.VALIDATION_ERROR,
                         "Amount must be greater than zero",
                         status=400
-                    )
+                    , request_id=request_id)
             except (TypeError, ValueError):
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Invalid amount provided",
                     status=400
-                )
+                , request_id=request_id)
             pledger_name = data.get('full_name') or 'Anonymous'
             pledger_contact = data.get('phone_number') or 'Anonymous'
             purpose = data.get('purpose') or 'No purpose specified'
-            contribution = ContributionService().get(alias=data.get('contribution'))
+            contribution = _contribution_service.get(alias=data.get('contribution'))
             if not contribution:
                 return self.create_error_response(
                     ErrorCodes.VALIDATION_ERROR,
                     "Contribution not found",
                     status=404
-                )
+                , request_id=request_id)
             planned_clear_date = data.get('planned_clear_date')
             if planned_clear_date:
                 try:
@@ -558,10 +932,9 @@ class BillingAdmin(View):
                         ErrorCodes.VALIDATION_ERROR,
                         "Invalid date format. Use ISO format (YYYY-MM-DD)",
                         status=400
-                    )
+                    , request_id=request_id)
             else:
                 planned_clear_date = timezone.now() + timezone.timedelta(days=30)
-            status = StateService().get(name="Pending")
             pledge = Pledge.objects.create(
                 pledger_name=pledger_name,
                 pledger_contact=pledger_contact,
@@ -569,7 +942,7 @@ class BillingAdmin(View):
                 purpose=purpose,
                 planned_clear_date=planned_clear_date,
                 contribution=contribution,
-                status=status
+                status_id=_state_id_by_name("Pending")
             )
             logger.info(f"Pledge created successfully: {pledge.id} ({request_id})")
             return self.create_success_response({
@@ -577,7 +950,7 @@ class BillingAdmin(View):
                 "message": "Pledge created successfully",
                 "pledge_id": str(pledge.id),
                 "amount": f"{amount:,.2f}"
-            })
+            }, request_id=request_id)
 
         except Exception as e:
             logger.exception(f"Pledge creation failed: {request_id} - {str(e)}")
@@ -585,9 +958,9 @@ class BillingAdmin(View):
                 ErrorCodes.INTERNAL_ERROR,
                 "Pledge processing failed",
                 status=500
-            )
+            , request_id=request_id)
         finally:
-            duration = round(time.time() - start_time, 3)
+            duration = round(_perf() - start_time, 3)
             logger.info(f"Pledge request completed: {request_id} in {duration}s")
 
     @method_decorator(csrf_exempt)
@@ -596,8 +969,8 @@ class BillingAdmin(View):
     @validate_request_data(['pledge', 'amount'])
     def clear_pledge(self, request):
         """Endpoint: Clear an existing pledge (Customer to Business)."""
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        request_id = _log_request_id()
+        start_time = _perf()
         try:
             data = self.unpack_request_data(request)
             logger.debug(f"Incoming pledge request {request_id}: {data}")
@@ -608,28 +981,32 @@ class BillingAdmin(View):
                     ErrorCodes.VALIDATION_ERROR,
                     "Pledge not found",
                     status=404
-                )
-            reference = f"{TransactionRefGenerator().generate()}{int(time.time())}"
+                , request_id=request_id)
+            reference = generate_ulid()
             base_amount = Decimal(str(data['amount']))
-            charge = Decimal(str(calculate_fair_charge(float(base_amount))))
+            charge = Decimal(str(calculate_fair_charge(base_amount)))
             total_amount = base_amount + charge
             logger.info(f"C2B payment initiated: {request_id} - {reference} for {total_amount}")
             response = self.client.receive_c2b_payment(
                 external_reference=reference,
                 amount=float(total_amount),
                 phone_number=data['phone_number'],
-                reason=f"Contribution on {timezone.now()}",
+                reason=f"Contribution on {_now_iso()}",
                 results_url=settings.PESAWAY_C2B_CALLBACK,
             )
             if not (response.success and response.data.get('code') == ErrorCodes.SUCCESS):
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     "Payment could not be initiated"
-                )
+                , request_id=request_id)
             receipt = response.data.get('TransactionID')
+            topup_data = {**data, 'ref': reference, 'charge': charge, "amount_plus_charge": total_amount, 'receipt': receipt}
+            # Same collision guard as b2c_transfer: a contribution field in
+            # the body must not clash with the hydrated kwarg.
+            topup_data.pop('contribution', None)
             topup_result = InitiateTopup().post(
-                contribution_id=pledge.contribution.id,
-                **{**data, 'ref': reference, 'charge': charge, "amount_plus_charge":total_amount,'receipt': receipt}
+                contribution=pledge.contribution,
+                **topup_data
             )
             pledge.add_payment(base_amount, user=pledge.pledger_name, note="")
             logger.info(f"Pledge cleared successfully: {pledge.id} ({topup_result})")
@@ -638,22 +1015,22 @@ class BillingAdmin(View):
                 "message": "Pledge created successfully",
                 "pledge_id": str(pledge.id),
                 "amount": f"{base_amount:,.2f}"
-            })
+            }, request_id=request_id)
         except Exception as e:
             logger.exception(f"Pledge creation failed: {request_id} - {e}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Pledge processing failed",
                 status=500
-            )
+            , request_id=request_id)
         finally:
-            duration = round(time.time() - start_time, 3)
+            duration = round(_perf() - start_time, 3)
             logger.info(f"Pledge request completed: {request_id} in {duration}s")
 
     @method_decorator(csrf_exempt)
     def c2b_payment_callback_endpoint(self, request):
         """C2B callback handler"""
-        request_id = str(uuid.uuid4())
+        request_id = _log_request_id()
         try:
             data = self.unpack_request_data(request)
             logger.info(f"C2B callback received: {request_id}")
@@ -661,27 +1038,42 @@ class BillingAdmin(View):
                     "successfully" in data.get("ResultDesc", "").lower()):
                 reference = data.get("OriginatorReference")
                 receipt = data.get("TransactionID")
-                approval_result = ApproveTopupTransaction().post(
-                    request, reference=reference, receipt=receipt
-                )
+                idem_key, replay = self._claim_idempotency("c2b", receipt)
+                if replay is not None:
+                    logger.info(f"Duplicate C2B callback replayed: {request_id} - {receipt}")
+                    return replay
+                try:
+                    approval_result = ApproveTopupTransaction().post(
+                        request, reference=reference, receipt=receipt
+                    )
+                except Exception:
+                    # Release the claim so a legitimate retry can process.
+                    cache.delete(idem_key)
+                    raise
                 logger.info(f"C2B transaction approved: {request_id}")
-                return self.create_success_response({
+                payload = {
                     "status": "APPROVED",
                     "reference": reference,
                     "receipt": receipt,
                     **approval_result
-                })
+                }
+                if str(approval_result.get("code", "")).startswith("200"):
+                    cache.set(f"{idem_key}:response", payload, self.IDEMPOTENCY_TTL)
+                else:
+                    # Approval didn't land; let a retry attempt it again.
+                    cache.delete(idem_key)
+                return self.create_success_response(payload, request_id=request_id)
             else:
                 return self.create_error_response(
                     ErrorCodes.TRANSACTION_FAILED,
                     "Transaction failed"
-                )
+                , request_id=request_id)
         except Exception as e:
             logger.exception(f"C2B callback failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Callback processing failed"
-            )
+            , request_id=request_id)
 
     @method_decorator(csrf_exempt)
     @method_decorator(require_http_methods(["POST"]))
@@ -689,49 +1081,65 @@ class BillingAdmin(View):
     @validate_request_data(['TransactionReference'])
     def query_mobile_money_transaction(self, request):
         """Query transaction status"""
-        request_id = str(uuid.uuid4())
+        request_id = _log_request_id()
 
         try:
             data = self.unpack_request_data(request)
             transaction_ref = data.get("TransactionReference")
             response = self.client.query_mobile_money_transaction(transaction_ref)
             if response.success:
-                return self.create_success_response(response.data)
+                return self.create_success_response(response.data, request_id=request_id)
             else:
                 return self.create_error_response(
                     ErrorCodes.INTERNAL_ERROR,
                     "Query failed"
-                )
+                , request_id=request_id)
         except Exception as e:
             logger.exception(f"Transaction query failed: {request_id} - {str(e)}")
             return self.create_error_response(
                 ErrorCodes.INTERNAL_ERROR,
                 "Query processing failed"
-            )
+            , request_id=request_id)
 
 
 billing_admin = BillingAdmin()
 
 
+# Probe responses are rebuilt at most once per second; within a second
+# every poller gets the same pre-serialized bytes.
+_health_payload = (0, b'')
+_ready_payload = (0, b'')
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def health_check(request):
     """Health check endpoint"""
-    return JsonResponse({
-        "status": "healthy",
-        "timestamp": timezone.now().isoformat(),
-        "service": "pesaway-wallet-api"
-    })
+    global _health_payload
+    now = int(time.time())
+    if _health_payload[0] != now:
+        body = json.dumps({
+            "status": "healthy",
+            "timestamp": _now_iso(),
+            "service": "pesaway-wallet-api"
+        }, separators=(',', ':')).encode()
+        _health_payload = (now, body)
+    return HttpResponse(_health_payload[1], content_type="application/json")
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def ready_check(request):
     """Readiness check endpoint"""
-    return JsonResponse({
-        "status": "ready",
-        "timestamp": timezone.now().isoformat()
-    })
+    global _ready_payload
+    now = int(time.time())
+    if _ready_payload[0] != now:
+        body = json.dumps({
+            "status": "ready",
+            "timestamp": _now_iso()
+        }, separators=(',', ':')).encode()
+        _ready_payload = (now, body)
+    return HttpResponse(_ready_payload[1], content_type="application/json")
 
 
 from django.urls import path, include
@@ -1,26 +1,40 @@
-import re
+from datetime import datetime, time, timedelta
+from decimal import Decimal
 from typing import Union, Optional
 
 from django.core.exceptions import ValidationError, ObjectDoesNotExist, PermissionDenied
-from django.core.files import File
 from dateutil.parser import parse
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
-from django.db.models.functions import Trim, Replace, Concat, Coalesce
-from django.forms.models import model_to_dict
-from django.db.models import Q, QuerySet, F, Value
-from django.db import transaction
+from django.db.models.functions import Cast, Concat, Substr
+from django.db.models import Case, CharField, IntegerField, Max, OuterRef, Q, QuerySet, F, Subquery, When, Value
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
 
-from base.backend.service import WalletAccountService, WalletTransactionService
+from base.backend.service import WalletTransactionService
+from billing.models import WalletAccount
 from contributions.backend.services import ContributionService
-from contributions.models import Contribution
-from notifications.backend.notification_management_service import NotificationManagementService
-from notifications.models import Notification
+from contributions.models import CONTRIBUTED_TOTAL, Contribution
 from users.models import User
-from utils.common import normalize_phone_number
+
+# Stateless CRUD service shared by the classmethods below; per-call
+# construction bought nothing.
+_contribution_service = ContributionService()
 
 
 class ContributionManagementService:
+    # Detail payloads are cached until the row's date_modified moves on.
+    DETAIL_CACHE_TTL = 300
+
+    # Columns the list endpoint actually serves; notably excludes the large
+    # description text. Callers that need every column pass queryset=True.
+    LIST_FIELDS = (
+        "id", "alias", "name", "profile_url", "is_private", "target_amount",
+        "end_date", "status", "date_created", "date_modified", "creator_id",
+        "creator_name", "available_wallet_amount",
+    )
+
     @classmethod
     def _generate_contribution_alias(cls) -> str:
         """
@@ -29,20 +43,58 @@ class ContributionManagementService:
         :return: A new alias in the format `C-XXXX`.
         :rtype: str
         """
-        last_contribution = (
-            Contribution.objects.select_for_update()
-            .exclude(alias__isnull=True)
-            .order_by("-alias")
-            .first()
+        if connection.vendor == 'postgresql':
+            # Race-free O(1): the dedicated sequence hands out the next
+            # number without sorting or locking the table.
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT nextval('contribution_alias_seq')")
+                next_number = cursor.fetchone()[0]
+            return f"C-{next_number:04d}"
+
+        # Fallback (dev databases without the sequence): the DB filters the
+        # C-NNNN pattern and aggregates the integer suffix, so a stray
+        # legacy alias sorting last can no longer silently restart at 1.
+        row = (
+            Contribution.objects
+            .filter(alias__regex=r"^C-\d{4}$")
+            .aggregate(n=Max(Cast(Substr("alias", 3), IntegerField())))
         )
-        if last_contribution and re.match(r"^C-\d{4}$", last_contribution.alias):
-            last_number = int(last_contribution.alias.split("-")[1])
-        else:
-            last_number = 0
+        last_number = row["n"] or 0
+
+        return f"C-{last_number + 1:04d}"
+
+    @classmethod
+    def _refresh_statuses(cls, filters: Q) -> None:
+        """
+        Set-based equivalent of calling update_status() per contribution.
 
-        alias = f"C-{last_number + 1:04d}"
+        A single conditional UPDATE replaces the two-to-three queries the
+        model method costs for every row; rows already in their target
+        status are excluded so date_modified only moves on transitions.
 
-        return alias
+        :param filters: The Q object selecting the contributions to refresh.
+        :type filters: Q
+        """
+        now = timezone.now()
+        base = Contribution.objects.filter(filters)
+        completed_ids = (
+            base.annotate(_contributed=CONTRIBUTED_TOTAL)
+            .filter(_contributed__gte=F("target_amount"))
+            .values("pk")
+        )
+        overdue = Q(end_date__date__lt=now.date())
+        base.exclude(
+            Q(pk__in=completed_ids, status=Contribution.Status.COMPLETED)
+            | Q(~Q(pk__in=completed_ids), overdue, status=Contribution.Status.OVERDUE)
+            | Q(~Q(pk__in=completed_ids), ~overdue, status=Contribution.Status.ONGOING)
+        ).update(
+            status=Case(
+                When(pk__in=completed_ids, then=Value(Contribution.Status.COMPLETED)),
+                When(overdue, then=Value(Contribution.Status.OVERDUE)),
+                default=Value(Contribution.Status.ONGOING),
+            ),
+            date_modified=now,
+        )
 
     @classmethod
     def get_contribution(cls, contribution_id: str) -> Contribution:
@@ -55,8 +107,12 @@ class ContributionManagementService:
         :return: The matching contribution instance.
         :rtype: Contribution
         """
+        # The creator join serves every caller that touches
+        # contribution.creator afterwards (detail payload, permission
+        # checks) without a second SELECT.
         contribution = (
             Contribution.objects
+            .select_related('creator')
             .exclude(status=Contribution.Status.INACTIVE)
             .filter(id=contribution_id)
             .first()
@@ -68,11 +124,10 @@ class ContributionManagementService:
         return contribution
 
     @classmethod
-    @transaction.atomic
     def create_contribution(
             cls,
             user: User,
-            name:str,
+            name: str,
             description: str,
             target_amount: float,
             end_date: str,
@@ -101,7 +156,8 @@ class ContributionManagementService:
         :return: The created contribution instance.
         :rtype: Contribution
         """
-        # Validate and normalize data
+        # Validate and normalize outside the transaction: pure-Python work
+        # shouldn't hold a DB connection and row locks open.
         name = name.strip().title()
         if not name:
             raise ValidationError("Contribution name must be provided")
@@ -114,37 +170,62 @@ class ContributionManagementService:
         if target_amount <= 0:
             raise ValidationError("Contribution amount must be greater than zero")
 
-        if not target_amount:
-            raise ValidationError("Target amount must be provided")
-        if not isinstance(target_amount, float):
-            target_amount = float(str(target_amount).strip())
-
-        try:
-            end_date = parse(end_date)
-        except Exception:
-            raise ValidationError("Invalid end date format")
+        # Skip the dateutil parse when the caller already has a datetime.
+        if not isinstance(end_date, datetime):
+            try:
+                end_date = parse(end_date)
+            except Exception:
+                raise ValidationError("Invalid end date format")
 
         description = description.strip()
 
-        # Create contribution
-        alias = cls._generate_contribution_alias()
-        contribution = ContributionService().create(
-            alias=alias,
+        return cls._persist_contribution(
+            user=user,
             name=name,
             description=description,
             target_amount=target_amount,
             end_date=end_date,
-            profile=photo,
-            creator=user,
-            is_private=is_private
+            is_private=is_private,
+            photo=photo,
         )
-        if not contribution:
-            raise Exception("Contribution not created")
+
+    @classmethod
+    @transaction.atomic
+    def _persist_contribution(
+            cls,
+            user: User,
+            name: str,
+            description: str,
+            target_amount: float,
+            end_date,
+            is_private: bool,
+            photo: Optional[UploadedFile],
+    ) -> Contribution:
+        """
+        Persist a validated contribution.
+
+        The transaction spans only the alias allocation and the INSERT;
+        the (creator, name) unique constraint makes the INSERT itself the
+        duplicate check — one round-trip, no pre-SELECT, no TOCTOU window.
+        """
+        alias = cls._generate_contribution_alias()
+        try:
+            contribution = Contribution.objects.create(
+                alias=alias,
+                name=name,
+                description=description,
+                target_amount=target_amount,
+                end_date=end_date,
+                profile=photo,
+                creator=user,
+                is_private=is_private
+            )
+        except IntegrityError:
+            raise ValidationError("You already have a contribution with this name")
 
         return contribution
 
     @classmethod
-    @transaction.atomic
     def update_contribution(
             cls,
             contribution_id: str,
@@ -180,41 +261,54 @@ class ContributionManagementService:
         :return: The updated contribution instance.
         :rtype: Contribution
         """
-        contribution = cls.get_contribution(contribution_id)
-
-        if contribution.creator != user:
-            raise PermissionDenied("You are not allowed to update this contribution")
-
-        # Normalize and validate fields
+        # Normalize and validate outside the transaction, collecting the
+        # columns that actually change.
+        changed = {}
         if name is not None:
             name = name.strip().title()
             if not name:
                 raise ValidationError("Contribution name cannot be empty")
-            contribution.name = name
+            changed["name"] = name
 
         if description is not None:
-            contribution.description = description.strip()
+            changed["description"] = description.strip()
 
         if target_amount is not None:
             try:
-                contribution.target_amount = float(str(target_amount).strip())
+                changed["target_amount"] = float(str(target_amount).strip())
             except (ValueError, TypeError):
                 raise ValidationError("Invalid target amount value")
 
         if end_date is not None:
-            try:
-                contribution.end_date = parse(end_date)
-            except Exception:
-                raise ValidationError("Invalid end date format")
+            if isinstance(end_date, datetime):
+                changed["end_date"] = end_date
+            else:
+                try:
+                    changed["end_date"] = parse(end_date)
+                except Exception:
+                    raise ValidationError("Invalid end date format")
 
         if is_private is not None:
-            contribution.is_private = bool(is_private)
+            changed["is_private"] = bool(is_private)
 
         if photo is not None:
-            contribution.profile = photo
+            changed["profile"] = photo
+
+        # The transaction spans only the creator-joined SELECT and the
+        # narrow UPDATE; the in-Python permission check keeps the 403/404
+        # distinction a WHERE-clause fold would lose.
+        with transaction.atomic():
+            contribution = cls.get_contribution(contribution_id)
 
-        # Persist changes
-        contribution.save()
+            if contribution.creator != user:
+                raise PermissionDenied("You are not allowed to update this contribution")
+
+            for field, value in changed.items():
+                setattr(contribution, field, value)
+
+            # Persist only the touched columns (plus the auto_now stamp)
+            if changed:
+                contribution.save(update_fields=list(changed) + ["date_modified"])
 
         return contribution
 
@@ -246,59 +340,106 @@ class ContributionManagementService:
 
         return contribution
 
+    # Transactions per detail page; popular contributions paginate with
+    # the keyset cursor instead of materialising every row.
+    TRANSACTIONS_PAGE_SIZE = 50
+
     @classmethod
-    def fetch_contribution(cls, contribution_id: str) -> dict:
+    def fetch_contribution(
+            cls,
+            contribution_id: str,
+            transactions_after: Optional[str] = None,
+            transactions_limit: int = TRANSACTIONS_PAGE_SIZE,
+    ) -> dict:
         """
         Retrieve full contribution details, including wallet and transactions.
 
         :param contribution_id: The unique identifier of the contribution.
         :type contribution_id: str
+        :param transactions_after: Keyset cursor ("<date_created iso>|<id>")
+            from a previous page's transactions_next_cursor.
+        :type transactions_after: str, optional
+        :param transactions_limit: Page size for the transactions list.
+        :type transactions_limit: int, optional
         :raises ObjectDoesNotExist: If the contribution is not found or inactive.
         :return: A dictionary with contribution, wallet, and transaction details.
         :rtype: dict
         """
-        contribution = cls.get_contribution(contribution_id)
+        # Same lookup as get_contribution, with the wallet balance pulled
+        # in as a subquery so the separate wallet SELECT disappears.
+        contribution = (
+            Contribution.objects
+            .select_related("creator")
+            .annotate(
+                _available_wallet_amount=Subquery(
+                    WalletAccount.objects.filter(
+                        contribution=OuterRef("pk")
+                    ).values("available")[:1]
+                )
+            )
+            .exclude(status=Contribution.Status.INACTIVE)
+            .filter(id=contribution_id)
+            .first()
+        )
+        if not contribution:
+            raise ObjectDoesNotExist("Contribution not found or inactive")
 
         # Update status
         contribution.update_status()
 
-        # Convert contribution model instance to dict
-        contribution_dict = model_to_dict(contribution)
-
-        # Add contribution photo url
-        if contribution.profile:
-            contribution_dict['profile'] = settings.MEDIA_URL + str(contribution.profile)
+        # Serve the cached payload while the row hasn't been modified;
+        # only the default first page is cached.
+        first_page = transactions_after is None and transactions_limit == cls.TRANSACTIONS_PAGE_SIZE
+        cache_key = f"contrib:{contribution.id}"
+        if first_page:
+            cached = cache.get(cache_key)
+            if cached is not None and cached.get("date_modified") == contribution.date_modified:
+                return cached
+
+        # Build the payload explicitly: model_to_dict walks _meta on every
+        # call and hands back values (FieldFile, raw FK) we then rework.
+        contribution_dict = {
+            "synced": contribution.synced,
+            "name": contribution.name,
+            "description": contribution.description,
+            "alias": contribution.alias,
+            "creator": contribution.creator_id,
+            "profile": (
+                settings.MEDIA_URL + str(contribution.profile)
+                if contribution.profile else None
+            ),
+            "is_private": contribution.is_private,
+            "target_amount": contribution.target_amount,
+            "end_date": contribution.end_date,
+            "status": contribution.status,
+        }
 
-        # Get wallet account
-        wallet_account = WalletAccountService().get(contribution=contribution)
-        available_wallet_amount = wallet_account.available
+        available_wallet_amount = contribution._available_wallet_amount
 
-        # Get transactions
-        transactions = list(
+        # Get transactions (keyset-paginated, newest first)
+        transactions_qs = (
             WalletTransactionService()
             .filter(
-                wallet_account=wallet_account,
+                wallet_account__contribution=contribution,
                 transaction_type="topup",
                 status__name="Completed",
             )
-            .annotate(
-                actioned_by_full_name=Trim(
-                    Replace(
-                        Concat(
-                            Coalesce(F("actioned_by__first_name"), Value("")),
-                            Value(" "),
-                            Coalesce(F("actioned_by__other_name"), Value("")),
-                            Value(" "),
-                            Coalesce(F("actioned_by__last_name"), Value("")),
-                        ),
-                        Value("  "),
-                        Value(" "),
-                    )
-                )
-            )
-            .order_by("-date_created")
-            .values()
+            .annotate(actioned_by_full_name=F("actioned_by__full_name_db"))
+            .order_by("-date_created", "-id")
         )
+        if transactions_after:
+            ts_str, _, id_str = transactions_after.partition("|")
+            after_ts = parse(ts_str)
+            transactions_qs = transactions_qs.filter(
+                Q(date_created__lt=after_ts)
+                | Q(date_created=after_ts, id__lt=id_str)
+            )
+        transactions = list(transactions_qs.values()[:transactions_limit])
+        if len(transactions) == transactions_limit:
+            last = transactions[-1]
+            transactions_next_cursor = f"{last['date_created'].isoformat()}|{last['id']}"
+        else:
+            transactions_next_cursor = None
 
         contribution_data = {
             **contribution_dict,
@@ -307,8 +448,11 @@ class ContributionManagementService:
             "date_modified": contribution.date_modified,
             "creator_name": contribution.creator.full_name,
             "available_wallet_amount": available_wallet_amount,
-            "transactions": transactions
+            "transactions": transactions,
+            "transactions_next_cursor": transactions_next_cursor
         }
+        if first_page:
+            cache.set(cache_key, contribution_data, cls.DETAIL_CACHE_TTL)
 
         return contribution_data
 
@@ -323,6 +467,8 @@ class ContributionManagementService:
             end_date: Optional[str] = None,
             is_private: Optional[bool] = None,
             queryset: bool = False,
+            stream: bool = False,
+            fields: Optional[tuple] = None,
     ) -> Union[QuerySet, list[dict]]:
         """
         Filter contributions based on search, date, creator, and visibility criteria.
@@ -343,7 +489,13 @@ class ContributionManagementService:
         :type is_private: bool, optional
         :param queryset: Whether to return a QuerySet instead of a list.
         :type queryset: bool, optional
-        :return: Filtered contributions as a QuerySet or list of dicts.
+        :param stream: Yield rows lazily (chunked server cursor) instead of
+            materialising the whole list — for exports/large tenants.
+        :type stream: bool, optional
+        :param fields: Columns to project instead of LIST_FIELDS.
+        :type fields: tuple, optional
+        :return: Filtered contributions as a QuerySet, list of dicts, or
+            a generator of dicts when streaming.
         :rtype: Union[QuerySet, list[dict]]
         """
         filters = Q()
@@ -364,11 +516,17 @@ class ContributionManagementService:
         if status:
             filters &= Q(status=status.upper())
 
+        # Compare against full timestamps: the __date lookup casts
+        # date_created per row, which defeats any index on the column.
         if start_date:
-            filters &= Q(date_created__date__gte=start_date)
+            start = timezone.make_aware(datetime.combine(parse(start_date).date(), time.min))
+            filters &= Q(date_created__gte=start)
 
         if end_date:
-            filters &= Q(date_created__date__lte=end_date)
+            end = timezone.make_aware(
+                datetime.combine(parse(end_date).date() + timedelta(days=1), time.min)
+            )
+            filters &= Q(date_created__lt=end)
 
         if is_private:
             filters &= Q(is_private=True)
@@ -380,38 +538,53 @@ class ContributionManagementService:
                 visibility_filter |= Q(is_private=True, creator=user)
             filters &= visibility_filter
 
+        if queryset:
+            # Raw-queryset consumers do their own status handling and
+            # projections; skip the refresh UPDATE and the list
+            # annotations entirely and just drop the heavyweight text.
+            return _contribution_service.filter(filters).defer("description")
+
         contributions = (
-            ContributionService()
+            _contribution_service
             .filter(filters)
             .annotate(
                 available_wallet_amount=F("wallet_accounts__available"),
-                creator_name=Trim(
-                    Replace(
-                        Concat(
-                            Coalesce(F("creator__first_name"), Value("")),
-                            Value(" "),
-                            Coalesce(F("creator__other_name"), Value("")),
-                            Value(" "),
-                            Coalesce(F("creator__last_name"), Value("")),
-                        ),
-                        Value("  "),
-                        Value(" "),
-                    )
-                )
+                creator_name=F("creator__full_name_db"),
+                # MEDIA_URL prefixed in the database so the Python side
+                # only renames the key back to "profile".
+                profile_url=Case(
+                    When(Q(profile="") | Q(profile__isnull=True), then=Value(None)),
+                    default=Concat(Value(settings.MEDIA_URL), F("profile")),
+                    output_field=CharField(),
+                ),
             )
         )
 
-        # Update contribution statuses
-        for contribution in contributions:
-            contribution.update_status()
+        # Update contribution statuses in bulk before evaluation: one
+        # conditional UPDATE, then the single annotated SELECT below.
+        # (UPDATE ... RETURNING can't carry the creator/wallet annotations
+        # this endpoint serves, so two statements is the floor here.)
+        cls._refresh_statuses(filters)
 
-        if queryset:
-            return contributions
+        if stream:
+            return cls._stream_rows(contributions, fields)
 
-        # Add photo urls
-        contributions = list(contributions.values())
+        contributions = list(contributions.values(*(fields or cls.LIST_FIELDS)))
         for contribution in contributions:
-            if contribution.get("profile"):
-                contribution["profile"] = f"{settings.MEDIA_URL}{contribution['profile']}"
+            if "profile_url" in contribution:
+                contribution["profile"] = contribution.pop("profile_url")
 
         return contributions
+
+    @classmethod
+    def _stream_rows(cls, contributions: QuerySet, fields: Optional[tuple] = None):
+        """
+        Yield list rows lazily with a chunked server-side cursor.
+
+        Keeps peak memory at O(chunk) instead of O(result set) for
+        exports and large tenants.
+        """
+        for row in contributions.values(*(fields or cls.LIST_FIELDS)).iterator(chunk_size=500):
+            if "profile_url" in row:
+                row["profile"] = row.pop("profile_url")
+            yield row
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-09-01 21:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0005_alter_contribution_description'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='contribution',
+            constraint=models.UniqueConstraint(fields=('creator', 'name'), name='uniq_creator_name'),
+        ),
+    ]
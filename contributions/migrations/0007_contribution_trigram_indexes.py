@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+def add_trigram_indexes(apps, schema_editor):
+    """pg_trgm GIN indexes so the icontains search stops sequential-scanning.
+
+    Postgres only; other vendors (the sqlite dev setup) skip silently.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS contributions_name_trgm "
+        "ON contributions_contribution USING gin (name gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS contributions_description_trgm "
+        "ON contributions_contribution USING gin (description gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS contributions_name_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS contributions_description_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0006_contribution_uniq_creator_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-09-01 21:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0007_contribution_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['date_created'], name='contributio_date_cr_4066f6_idx'),
+        ),
+    ]
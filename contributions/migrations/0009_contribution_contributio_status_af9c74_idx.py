@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-09-01 21:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0008_contribution_contributio_date_cr_4066f6_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['status', 'end_date'], name='contributio_status_af9c74_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def create_alias_sequence(apps, schema_editor):
+    """Dedicated sequence for C-XXXX aliases, seeded from the current max.
+
+    Postgres only; other vendors fall back to the aggregate path in
+    ContributionManagementService._generate_contribution_alias.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE SEQUENCE IF NOT EXISTS contribution_alias_seq")
+    schema_editor.execute(
+        "SELECT setval('contribution_alias_seq', GREATEST(1, ("
+        "SELECT COALESCE(MAX(CAST(SUBSTRING(alias FROM 3) AS INT)), 0) "
+        "FROM contributions_contribution WHERE alias ~ '^C-[0-9]{4}$')))"
+    )
+
+
+def drop_alias_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP SEQUENCE IF EXISTS contribution_alias_seq")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0009_contribution_contributio_status_af9c74_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_alias_sequence, drop_alias_sequence),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-09-01 21:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0010_contribution_alias_seq'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['is_private', 'status', 'date_created'], name='contributio_is_priv_5b5fcf_idx'),
+        ),
+    ]
@@ -2,10 +2,13 @@ import os
 from datetime import datetime
 from decimal import Decimal
 
+from django.core.cache import cache
 from django.core.files.storage import FileSystemStorage
 from django.db import models
-from django.db.models import Sum, Count
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.apps import apps  # Lazy import for related models
 
@@ -30,6 +33,51 @@ def default_uploads_to(instance, filename):
 
 document_storage = FileSystemStorage(location="/srv/documents")
 
+# Net contributed amount as a reusable filtered-aggregate expression.
+# Built once at import; Django resolves a copy per query, so the admin
+# changelist, the bulk status refresh and with_stats() share the same
+# definition.
+_ZERO_AMOUNT = Value(Decimal("0.00"), output_field=models.DecimalField(max_digits=12, decimal_places=2))
+_COMPLETED_TOPUPS = Q(
+    wallet_accounts__transactions__status__name="Completed",
+    wallet_accounts__transactions__transaction_type="topup",
+)
+CONTRIBUTED_TOTAL = Coalesce(
+    Sum("wallet_accounts__transactions__amount", filter=_COMPLETED_TOPUPS),
+    _ZERO_AMOUNT,
+) - Coalesce(
+    Sum(
+        "wallet_accounts__transactions__amount",
+        filter=Q(
+            wallet_accounts__transactions__status__name="Completed",
+            wallet_accounts__transactions__transaction_type="payment",
+        ),
+    ), _ZERO_AMOUNT,
+)
+
+
+class ContributionQuerySet(models.QuerySet):
+    def with_stats(self):
+        """
+        Annotate every row's aggregate stats in a single query.
+
+        Lists that read the aggregate properties per row otherwise pay
+        several aggregate queries per contribution; the properties below
+        prefer these annotations when present.
+        """
+        return self.annotate(
+            _total_contributed=CONTRIBUTED_TOTAL,
+            _transactions_count=Count(
+                "wallet_accounts__transactions", filter=_COMPLETED_TOPUPS
+            ),
+            _contributors_count=Count(
+                "wallet_accounts__transactions__actioned_by",
+                filter=_COMPLETED_TOPUPS,
+                distinct=True,
+            ),
+        )
+
+
 class Contribution(GenericBaseModel):
     class Status(models.TextChoices):
         ONGOING = "ONGOING", _("Ongoing")
@@ -45,8 +93,23 @@ class Contribution(GenericBaseModel):
     end_date = models.DateTimeField()
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ONGOING)
 
+    objects = ContributionQuerySet.as_manager()
+
     class Meta:
-        indexes = [models.Index(fields=['creator'])]
+        indexes = [
+            models.Index(fields=['creator']),
+            models.Index(fields=['date_created']),
+            # Serves the status filters and the end_date-driven status
+            # refresh; (creator, name) is already indexed by the unique
+            # constraint below.
+            models.Index(fields=['status', 'end_date']),
+            # Covering path for filter_contributions' common predicate
+            # combination: visibility + status, ordered/ranged by creation.
+            models.Index(fields=['is_private', 'status', 'date_created']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['creator', 'name'], name='uniq_creator_name'),
+        ]
         ordering = ('-date_created',)
 
     def __str__(self):
@@ -70,10 +133,18 @@ class Contribution(GenericBaseModel):
             transaction_type='payment'
         )
 
-    @property
+    @cached_property
+    def _topup_stats(self) -> dict:
+        """Sum and count of completed topups in one aggregate query."""
+        return self._transactions().aggregate(total=Sum("amount"), n=Count("id"))
+
+    @cached_property
     def total_contributed(self) -> Decimal:
-        """Total amount contributed so far."""
-        topups = self._transactions().aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
+        """Total amount contributed so far (cached per instance)."""
+        annotated = getattr(self, "_total_contributed", None)
+        if annotated is not None:
+            return annotated
+        topups = self._topup_stats["total"] or Decimal("0.00")
         payments = self._payment_transactions().aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
         return topups - payments
 
@@ -89,15 +160,28 @@ class Contribution(GenericBaseModel):
             return round((self.total_contributed / self.target_amount) * 100, 2)
         return 0.0
 
-    @property
+    @cached_property
     def contributors_count(self) -> int:
         """Number of unique contributors."""
-        return self._transactions().values("wallet_account__user").distinct().count()
-
-    @property
+        annotated = getattr(self, "_contributors_count", None)
+        if annotated is not None:
+            return annotated
+        # WalletAccount has no user column; contributors are the users who
+        # actioned the completed topups.
+        return self._transactions().values("actioned_by").distinct().count()
+
+    @cached_property
     def transactions_count(self) -> int:
         """Total number of contribution transactions."""
-        return self._transactions().count()
+        annotated = getattr(self, "_transactions_count", None)
+        if annotated is not None:
+            return annotated
+        return self._topup_stats["n"]
+
+    def invalidate_stats(self):
+        """Drop the per-instance aggregate caches (e.g. after new topups)."""
+        for name in ("_topup_stats", "total_contributed", "transactions_count", "contributors_count"):
+            self.__dict__.pop(name, None)
 
     def get_remaining_days(self) -> int:
         """Days left until contribution end date (negative if overdue)."""
@@ -114,12 +198,16 @@ class Contribution(GenericBaseModel):
     def update_status(self):
         """Auto-update status based on progress and deadlines."""
         if self.is_completed():
-            self.status = self.Status.COMPLETED
+            new_status = self.Status.COMPLETED
         elif self.is_overdue():
-            self.status = self.Status.OVERDUE
+            new_status = self.Status.OVERDUE
         else:
-            self.status = self.Status.ONGOING
-        self.save(update_fields=["status", "date_modified"])
+            new_status = self.Status.ONGOING
+        # Only touch the row when the status actually transitions; the
+        # unconditional save rewrote date_modified on every read path.
+        if new_status != self.status:
+            self.status = new_status
+            self.save(update_fields=["status", "date_modified"])
 
     def latest_transaction(self):
         """Get most recent transaction."""
@@ -132,9 +220,23 @@ class Contribution(GenericBaseModel):
         return total / count if count > 0 else Decimal("0.00")
 
     def top_contributor(self):
-        """Find user who contributed the most."""
-        return self._transactions().values(
-            "wallet_account__user__id", "wallet_account__user__username"
-        ).annotate(
-            total=Sum("amount")
-        ).order_by("-total").first()
+        """Find user who contributed the most.
+
+        The GROUP BY over all completed topups is cached keyed on the
+        newest transaction id, so the expensive scan reruns only when a
+        new contribution actually lands.
+        """
+        latest = self.latest_transaction()
+        if latest is None:
+            return None
+        key = f"contrib:top:{self.id}:{latest.id}"
+        return cache.get_or_set(
+            key,
+            lambda: self._transactions().values(
+                "actioned_by__id", "actioned_by__username"
+            ).annotate(
+                total=Sum("amount")
+            ).order_by("-total").first(),
+            300,
+        )
+
@@ -70,8 +70,10 @@ class ContributionAPIHandler:
     @classmethod
     def get_contribution(cls, request):
         contribution_id = request.data.get("contribution_id")
+        transactions_after = request.data.get("transactions_after")
         contribution_data = ContributionManagementService().fetch_contribution(
-            contribution_id=contribution_id
+            contribution_id=contribution_id,
+            transactions_after=transactions_after
         )
 
         return ResponseProvider.success(
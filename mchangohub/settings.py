@@ -61,6 +61,7 @@ MIDDLEWARE = [
     'api.middleware.gateway.GatewayControlMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'billing.fastroute.FastRouteMiddleware',
 ]
 
 ROOT_URLCONF = 'mchangohub.urls'
@@ -109,6 +110,10 @@ DATABASES = {
 		'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
 		'HOST': os.environ.get('POSTGRES_HOST'),
 		'PORT': os.environ.get('POSTGRES_PORT'),
+		# Persistent connections: reuse the TCP/TLS connection across
+		# requests instead of reconnecting to Postgres on every one.
+		'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+		'CONN_HEALTH_CHECKS': True,
 	}
 }
 
@@ -129,6 +134,19 @@ CACHES = {
     }
 }
 
+# Rate-limit counters get their own alias so the limiter is always backed
+# by Redis (shared across workers/pods) even if the default cache is ever
+# swapped for a per-process backend.
+CACHES['ratelimit'] = {
+    'BACKEND': 'django_redis.cache.RedisCache',
+    'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
+    'OPTIONS': {
+        'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+    },
+    'KEY_PREFIX': 'pesaway',
+    'VERSION': 1,
+}
+
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_AGE = 3600  # 1 hour
@@ -198,6 +216,9 @@ ACTION_OTP_VALIDITY_SECONDS = 360
 OTP_MAX_RETRIES = 5
 
 QUEUE_NOTIFICATIONS = False
+# Offload InitiatePayment/InitiateTopup persistence to Celery so payment
+# responses return as soon as Pesaway accepts the request.
+QUEUE_BILLING_PERSISTENCE = False
 NOTIFY_BASE_URL = "https://notify.rentwaveafrica.co.ke"
 
 
@@ -227,9 +248,9 @@ PESAWAY_REQUEST_TIMEOUT = int(os.getenv('PESAWAY_REQUEST_TIMEOUT', 30))
 CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5))
 CIRCUIT_BREAKER_TIMEOUT = int(os.getenv('CIRCUIT_BREAKER_TIMEOUT', 60))
 
-PESAWAY_CALLBACK_SIGNATURE_KEY = "!E3hFu@Ljsz0kF2@31h12e[Lf6eE49GF"
-PESAWAY_CLIENT_SECRET = "941CUfQEP_7DpU50"
-PESAWAY_CLIENT_ID = "@8E1th1@!WXq9C;&_@L;6e03&93re#20"
+PESAWAY_CALLBACK_SIGNATURE_KEY = os.environ.get("PESAWAY_CALLBACK_SIGNATURE_KEY")
+PESAWAY_CLIENT_SECRET = os.environ.get("PESAWAY_CLIENT_SECRET")
+PESAWAY_CLIENT_ID = os.environ.get("PESAWAY_CLIENT_ID")
 PESAWAY_BASE_URL = os.environ.get("PESAWAY_BASE_URL", "https://api.pesaway.com")
 PESAWAY_B2C_CALLBACK = "https://api.mchangohub.com/api/billing/api/v1/callbacks/b2c/"
 PESAWAY_C2B_CALLBACK = "https://api.mchangohub.com/api/billing/api/v1/callbacks/c2b/"
@@ -237,3 +258,13 @@ PESAWAY_C2B_CALLBACK = "https://api.mchangohub.com/api/billing/api/v1/callbacks/
 DATA_UPLOAD_MAX_MEMORY_SIZE = 30 * 1024 * 1024
 FILE_UPLOAD_MAX_MEMORY_SIZE = 30 * 1024 * 1024
 
+# Optional request profiling (django-silk). Opt in with ENABLE_SILK=1 on
+# staging to capture per-request SQL time and Python profiles for the
+# contribution endpoints and admin changelist before further tuning.
+ENABLE_SILK = os.environ.get('ENABLE_SILK') == '1'
+if ENABLE_SILK:
+    INSTALLED_APPS.append('silk')
+    MIDDLEWARE.insert(0, 'silk.middleware.SilkyMiddleware')
+    SILKY_PYTHON_PROFILER = os.environ.get('SILKY_PYTHON_PROFILER') == '1'
+    SILKY_PERMISSIONS = lambda user: user.is_superuser
+
@@ -4,7 +4,6 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db.models import Q, QuerySet
 from django.db import transaction
 from django.db.models.expressions import F
-from django.forms import model_to_dict
 
 from notifications.backend.notification_management_service import NotificationManagementService
 from notifications.models import Notification
@@ -201,10 +200,14 @@ class UserManagementService:
         user.set_password(new_password)
         user.save()
 
-        NotificationManagementService(user).send_notification(
-            delivery_method=Notification.DeliveryMethods.SMS,
-            template="sms_reset_password",
-            context={"password": new_password}
+        # Send after commit: the gateway call must not hold the transaction
+        # (and its row locks) open, nor fire if the password save rolls back.
+        transaction.on_commit(
+            lambda: NotificationManagementService(user).send_notification(
+                delivery_method=Notification.DeliveryMethods.SMS,
+                template="sms_reset_password",
+                context={"password": new_password}
+            )
         )
 
         return None
@@ -276,13 +279,32 @@ class UserManagementService:
         if not user:
             raise ObjectDoesNotExist("User not found")
 
-        user_dict = model_to_dict(user)
-        user_dict["id"] = str(user.id)
-        user_dict["role_name"] = user.role.name
-        user_dict["permissions"] = user.permissions
-        user_dict.pop("password", None)
-
-        return user_dict
+        # Explicit attribute reads instead of model_to_dict: no _meta
+        # reflection, no password key to scrub, and no extra queries for
+        # the unused auth m2m fields it used to include.
+        return {
+            "id": str(user.id),
+            "synced": user.synced,
+            "last_login": user.last_login,
+            "is_superuser": user.is_superuser,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "is_staff": user.is_staff,
+            "is_active": user.is_active,
+            "date_joined": user.date_joined,
+            "id_number": user.id_number,
+            "other_name": user.other_name,
+            "phone_number": user.phone_number,
+            "other_phone_number": user.other_phone_number,
+            "gender": user.gender,
+            "dob": user.dob,
+            "is_verified": user.is_verified,
+            "role": user.role_id,
+            "role_name": user.role.name,
+            "permissions": user.permissions,
+        }
 
     @staticmethod
     def filter_users(
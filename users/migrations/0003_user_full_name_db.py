@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-09-01 21:25
+
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_permission_description_alter_role_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name_db',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Trim(django.db.models.functions.text.Replace(django.db.models.functions.text.Concat(django.db.models.functions.comparison.Coalesce(models.F('first_name'), models.Value('')), models.Value(' '), django.db.models.functions.comparison.Coalesce(models.F('other_name'), models.Value('')), models.Value(' '), django.db.models.functions.comparison.Coalesce(models.F('last_name'), models.Value(''))), models.Value('  '), models.Value(' '))), output_field=models.CharField(max_length=302)),
+        ),
+    ]
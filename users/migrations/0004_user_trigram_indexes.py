@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def add_trigram_indexes(apps, schema_editor):
+    """pg_trgm GIN indexes for the creator legs of the contribution search.
+
+    Postgres only; other vendors (the sqlite dev setup) skip silently.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ('username', 'email', 'phone_number'):
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS users_{column}_trgm "
+            f"ON users_user USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in ('username', 'email', 'phone_number'):
+        schema_editor.execute(f"DROP INDEX IF EXISTS users_{column}_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_full_name_db'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_indexes, drop_trigram_indexes),
+    ]
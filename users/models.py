@@ -3,6 +3,8 @@ import random
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Concat, Replace, Trim
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -86,6 +88,26 @@ class User(BaseModel, AbstractUser):
     role = models.ForeignKey('users.Role', on_delete=models.CASCADE)
     is_verified = models.BooleanField(default=True)
     last_activity = models.DateTimeField(null=True, blank=True, editable=False)
+    # Stored by the database so queries can reference creator__full_name_db
+    # directly instead of rebuilding the Trim/Replace/Concat expression
+    # per row per query.
+    full_name_db = models.GeneratedField(
+        expression=Trim(
+            Replace(
+                Concat(
+                    Coalesce(F("first_name"), Value("")),
+                    Value(" "),
+                    Coalesce(F("other_name"), Value("")),
+                    Value(" "),
+                    Coalesce(F("last_name"), Value("")),
+                ),
+                Value("  "),
+                Value(" "),
+            )
+        ),
+        output_field=models.CharField(max_length=402),
+        db_persist=True,
+    )
 
     manager = CustomUserManager()
 
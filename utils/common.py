@@ -1,6 +1,7 @@
 import logging
 import json
 import random
+import re
 import string
 
 from django.conf import settings
@@ -9,6 +10,10 @@ from django.http import QueryDict
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: one C-level pass strips all formatting characters instead
+# of four chained str.replace() copies per phone number.
+_PHONE_CLEAN_RE = re.compile(r"[\s()\-]")
+
 def get_request_data(request: WSGIRequest) -> tuple[dict, dict]:
     """
     Extracts structured data and uploaded files from a Django request.
@@ -27,7 +32,9 @@ def get_request_data(request: WSGIRequest) -> tuple[dict, dict]:
         content_type = request.META.get('CONTENT_TYPE', '')
         data = {}
         files = {}
+        json_attempted = False
         if 'application/json' in content_type:
+            json_attempted = True
             try:
                 data = json.loads(request.body)
             except json.JSONDecodeError:
@@ -42,7 +49,7 @@ def get_request_data(request: WSGIRequest) -> tuple[dict, dict]:
                 else request.FILES[key]
                 for key in request.FILES
             }
-        if not data and request.body:
+        if not data and request.body and not json_attempted:
             try:
                 data = json.loads(request.body)
             except Exception:
@@ -121,7 +128,7 @@ def normalize_phone_number(phone, country_code=None, total_count=None):
             country_code = settings.DEFAULT_COUNTRY_CODE
         if total_count is None:
             total_count = settings.PHONE_NUMBER_LENGTH
-        phone = phone.replace(" ", "").replace('(', '').replace(')', '').replace('-', '')
+        phone = _PHONE_CLEAN_RE.sub('', phone)
         if str(phone).startswith('+'):
             phone = str(phone)[1:]
         if len(phone) == total_count:
@@ -137,7 +144,7 @@ def normalize_phone_number(phone, country_code=None, total_count=None):
             else:
                 return phone
     except Exception as ex:
-        print('normalize_phone_number Exception: %s', ex)
+        logger.exception('normalize_phone_number Exception: %s', ex)
     return ''
 
 
@@ -73,6 +73,21 @@ class ServiceBase:
             logger.exception('%sService create exception: %s', self.manager.model.__name__, e)
         return None
 
+    def get_or_create(self, defaults=None, **kwargs):
+        """
+        Get a record matching kwargs or create it with defaults.
+
+        :param defaults: Field values only applied on create.
+        :type defaults: dict
+        :return: Tuple of (object, created) or (None, False).
+        """
+        try:
+            if self.manager is not None:
+                return self.manager.get_or_create(defaults=defaults, **kwargs)
+        except Exception as e:
+            logger.exception('%sService get_or_create exception: %s', self.manager.model.__name__, e)
+        return None, False
+
     def update(self, pk, **kwargs):
         """
         Update a record by its primary key.